@@ -10,6 +10,7 @@ from .crypto import (
     is_encrypted,
     EncryptionError,
 )
+from .executors import cpu_executor
 
 __all__ = [
     'encrypt',
@@ -18,4 +19,5 @@ __all__ = [
     'verify_encryption_key',
     'is_encrypted',
     'EncryptionError',
+    'cpu_executor',
 ]
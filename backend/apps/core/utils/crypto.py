@@ -8,6 +8,7 @@ Migrated from backend/src/utils/encryption.ts
 import hashlib
 import base64
 import os
+from functools import lru_cache
 from typing import Optional
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from django.conf import settings
@@ -23,6 +24,14 @@ IV_LENGTH = 12  # 96 bits - recommended for GCM
 TAG_LENGTH = 16  # 128 bits - authentication tag
 KEY_LENGTH = 32  # 256 bits for AES-256
 
+# Shortest base64 string encrypt() can produce: IV + 1 byte ciphertext + tag.
+# Legacy hex iv:ciphertext values are longer still (32 + 1 + 32 chars).
+MIN_ENCRYPTED_LENGTH = 4 * -(-(IV_LENGTH + 1 + TAG_LENGTH) // 3)
+
+# Characters that can open/close an encrypted value (base64 alphabet covers hex)
+_B64_FIRST = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/')
+_B64_LAST = _B64_FIRST | frozenset('=')
+
 
 def get_key() -> bytes:
     """
@@ -39,6 +48,20 @@ def get_key() -> bytes:
     return key
 
 
+@lru_cache(maxsize=None)
+def _get_cipher() -> AESGCM:
+    """
+    Build the AES-256-GCM cipher once per process.
+    
+    AESGCM holds no per-message state, so one instance is safe to share
+    across threads. Picking up a rotated ENCRYPTION_KEY requires a restart.
+    
+    Returns:
+        AESGCM instance bound to the configured key
+    """
+    return AESGCM(get_key())
+
+
 def _validate_encrypted_format(data: bytes) -> bool:
     """
     Validate that encrypted data has the correct format.
@@ -88,11 +111,8 @@ def encrypt(text: str) -> str:
         # Generate random IV (12 bytes for GCM - NIST recommended)
         iv = os.urandom(IV_LENGTH)
         
-        # Create AESGCM cipher
-        aesgcm = AESGCM(get_key())
-        
         # Encrypt (GCM automatically appends authentication tag)
-        ciphertext = aesgcm.encrypt(iv, text.encode('utf-8'), None)
+        ciphertext = _get_cipher().encrypt(iv, text.encode('utf-8'), None)
         
         # Combine IV + ciphertext (tag is already appended by GCM)
         encrypted_data = iv + ciphertext
@@ -206,11 +226,8 @@ def decrypt(text: str) -> str:
         iv = encrypted_data[:IV_LENGTH]
         ciphertext = encrypted_data[IV_LENGTH:]
         
-        # Create AESGCM cipher
-        aesgcm = AESGCM(get_key())
-        
         # Decrypt (GCM automatically verifies authentication tag)
-        plaintext = aesgcm.decrypt(iv, ciphertext, None)
+        plaintext = _get_cipher().decrypt(iv, ciphertext, None)
         
         return plaintext.decode('utf-8')
     
@@ -278,6 +295,15 @@ def is_encrypted(text: str) -> bool:
     if not text or not isinstance(text, str):
         return False
     
+    # Fast path: plaintext that is too short or starts/ends outside the
+    # base64 alphabet can never be one of our ciphertexts
+    if (
+        len(text) < MIN_ENCRYPTED_LENGTH
+        or text[0] not in _B64_FIRST
+        or text[-1] not in _B64_LAST
+    ):
+        return False
+    
     # Check for legacy hex format (iv:ciphertext)
     if ':' in text and len(text.split(':')) == 2:
         parts = text.split(':')
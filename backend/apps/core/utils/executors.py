@@ -0,0 +1,16 @@
+"""
+Shared executors for offloading blocking work from async views.
+
+sync_to_async's thread-sensitive executor is reserved for ORM calls; CPU-bound
+helpers (e.g. encryption of large payloads) run here instead so they don't
+queue behind, or hold up, database I/O.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+cpu_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix='cpu-worker',
+)
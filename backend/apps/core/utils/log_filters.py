@@ -0,0 +1,40 @@
+"""
+Logging filters.
+
+Used from settings.LOGGING to keep log storms (e.g. a batch of rows that
+fail to decrypt after a key change) from flooding the console.
+"""
+
+import logging
+import threading
+import time
+
+
+class RateLimitingFilter(logging.Filter):
+    """
+    Token-bucket filter that lets through at most `rate` records per `per`
+    seconds and silently drops the rest.
+    """
+
+    def __init__(self, rate: float = 10, per: float = 1.0):
+        super().__init__()
+        self.rate = float(rate)
+        self.per = float(per)
+        self._allowance = self.rate
+        self._last_check = time.monotonic()
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._last_check
+            self._last_check = now
+
+            # Refill the bucket for the time that has passed, capped at `rate`
+            self._allowance = min(self.rate, self._allowance + elapsed * (self.rate / self.per))
+
+            if self._allowance < 1.0:
+                return False
+
+            self._allowance -= 1.0
+            return True
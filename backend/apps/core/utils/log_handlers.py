@@ -0,0 +1,59 @@
+"""
+Logging handlers.
+
+Used from settings.LOGGING so that logging from async views doesn't block
+the event loop on a synchronous stdout/stderr write.
+"""
+
+import logging
+import os
+import queue
+import weakref
+from logging.handlers import QueueHandler, QueueListener
+
+# Live handlers, so their listener threads can be restarted after a fork
+_handlers = weakref.WeakSet()
+
+
+def _restart_listeners_in_child():
+    # A forked child (e.g. a prefork Celery worker) inherits the handler but
+    # not its listener thread; without a new one records would only queue up
+    for handler in list(_handlers):
+        if handler._listener is not None:
+            handler._start_listener()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_listeners_in_child)
+
+
+class QueuedStreamHandler(QueueHandler):
+    """
+    StreamHandler replacement that hands records to a background thread.
+
+    Records are filtered and formatted on the calling thread, so the
+    formatter and filters configured for this handler behave as usual;
+    the listener thread only does the stream write.
+    """
+
+    def __init__(self, stream=None):
+        super().__init__(queue.SimpleQueue())
+        self._stream_handler = logging.StreamHandler(stream)
+        self._listener = None
+        self._start_listener()
+        _handlers.add(self)
+
+    def _start_listener(self):
+        # Fresh queue as well: after a fork the inherited one may still hold
+        # records the parent's listener is about to write
+        self.queue = queue.SimpleQueue()
+        self._listener = QueueListener(self.queue, self._stream_handler)
+        self._listener.start()
+
+    def close(self):
+        # Called by logging.shutdown() at exit and when LOGGING is reapplied;
+        # stop() drains whatever is still queued before the thread exits
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
+        super().close()
@@ -0,0 +1,22 @@
+# Generated by Django 5.0 on 2026-10-16 19:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('conversations', '0002_add_pending_outgoing_message'),
+        ('messaging', '0002_add_pending_outgoing_message'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['conversation', '-sent_at'], name='msg_conv_sentat_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['conversation', 'is_read', 'is_outgoing'], name='msg_conv_read_out_idx'),
+        ),
+    ]
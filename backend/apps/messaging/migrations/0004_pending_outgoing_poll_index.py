@@ -0,0 +1,21 @@
+# Generated by Django 5.0 on 2026-10-16 19:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('messaging', '0003_message_conversation_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='pendingoutgoingmessage',
+            name='pending_out_user_id_943060_idx',
+        ),
+        migrations.AddIndex(
+            model_name='pendingoutgoingmessage',
+            index=models.Index(fields=['user_id', 'platform', 'status', 'created_at'], name='pending_user_plat_st_crt_idx'),
+        ),
+    ]
@@ -7,6 +7,7 @@ Migrated from backend/db/init.sql - messages table
 import uuid
 from django.db import models
 from apps.conversations.models import Conversation
+from apps.core.utils.crypto import decrypt, encrypt, is_encrypted
 from apps.oauth.models import ConnectedAccount
 
 
@@ -23,6 +24,8 @@ class Message(models.Model):
         ('video', 'Video'),
         ('file', 'File'),
     ]
+    # O(1) membership checks on validation paths
+    MESSAGE_TYPES = frozenset(value for value, _ in MESSAGE_TYPE_CHOICES)
     
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     conversation = models.ForeignKey(
@@ -53,6 +56,10 @@ class Message(models.Model):
             models.Index(fields=['conversation']),
             models.Index(fields=['-sent_at']),
             models.Index(fields=['is_read'], name='idx_messages_is_read'),  # Removed condition for MySQL
+            # Conversation page ordered by newest first (ORDER BY + LIMIT via index walk)
+            models.Index(fields=['conversation', '-sent_at'], name='msg_conv_sentat_idx'),
+            # Mark-conversation-read UPDATE filter
+            models.Index(fields=['conversation', 'is_read', 'is_outgoing'], name='msg_conv_read_out_idx'),
         ]
         ordering = ['-sent_at']
     
@@ -96,7 +103,7 @@ class PendingOutgoingMessage(models.Model):
     platform = models.CharField(max_length=50)  # e.g., 'instagram'
     platform_conversation_id = models.CharField(max_length=255)  # Thread ID
     recipient_id = models.CharField(max_length=255)  # Recipient user ID
-    content = models.TextField()
+    content = models.TextField()  # Encrypted at rest, like Message.content
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     error_message = models.TextField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -105,10 +112,28 @@ class PendingOutgoingMessage(models.Model):
     class Meta:
         db_table = 'pending_outgoing_messages'
         indexes = [
-            models.Index(fields=['user_id', 'platform', 'status']),
+            # Desktop App poll: WHERE user_id, platform, status ORDER BY created_at
+            models.Index(fields=['user_id', 'platform', 'status', 'created_at'], name='pending_user_plat_st_crt_idx'),
             models.Index(fields=['created_at']),
         ]
         ordering = ['created_at']
     
     def __str__(self):
-        return f'[{self.status}] {self.platform}: {self.content[:50]}...'
+        return f'[{self.status}] {self.platform}: {self.id}'
+    
+    @property
+    def plain_content(self):
+        """Decrypted content for the Desktop App (older rows may be plaintext)"""
+        if self.content and is_encrypted(self.content):
+            try:
+                return decrypt(self.content)
+            except Exception:
+                pass
+        return self.content
+    
+    @property
+    def encrypted_content(self):
+        """Content ready to store on a Message row, without re-encrypting"""
+        if self.content and is_encrypted(self.content):
+            return self.content
+        return encrypt(self.content)
@@ -2,13 +2,20 @@
 Message serializers for request/response validation.
 """
 
+import logging
+
 from rest_framework import serializers
 from .models import Message
 from apps.core.utils.crypto import decrypt, is_encrypted
 
+logger = logging.getLogger(__name__)
+
 
 class MessageSerializer(serializers.ModelSerializer):
     """Serializer for Message model"""
+    # Declared explicitly so DRF emits canonical UUID strings directly
+    id = serializers.UUIDField(read_only=True)
+    conversation_id = serializers.UUIDField(read_only=True)
     
     class Meta:
         model = Message
@@ -33,18 +40,12 @@ class MessageSerializer(serializers.ModelSerializer):
         """Decrypt content before sending to frontend"""
         data = super().to_representation(instance)
         
-        # Convert UUID fields to strings for JSON serialization
-        if data.get('id'):
-            data['id'] = str(data['id'])
-        if data.get('conversation_id'):
-            data['conversation_id'] = str(data['conversation_id'])
-        
         # Decrypt content if it's encrypted (base64 encoded AES-256-GCM)
         if data.get('content') and is_encrypted(data['content']):
             try:
                 data['content'] = decrypt(data['content'])
             except Exception as e:
-                print(f'[serializer] Failed to decrypt content: {e}')
+                logger.warning('[serializer] Failed to decrypt content: %s', e)
                 # Keep original content if decryption fails
         
         # Decrypt media_url if it's encrypted
@@ -52,19 +53,70 @@ class MessageSerializer(serializers.ModelSerializer):
             try:
                 data['media_url'] = decrypt(data['media_url'])
             except Exception as e:
-                print(f'[serializer] Failed to decrypt media_url: {e}')
+                logger.warning('[serializer] Failed to decrypt media_url: %s', e)
         
         return data
 
 
+# Columns returned by read-only message list endpoints (same shape as MessageSerializer)
+MESSAGE_LIST_FIELDS = tuple(MessageSerializer.Meta.fields)
+
+# Reused to format datetimes exactly like DRF does, without a serializer per row
+_datetime_field = serializers.DateTimeField()
+
+
+def serialize_message_rows(queryset, extra_fields=()):
+    """
+    Serialize messages for read-only list responses via .values().
+    
+    Produces the same payload as MessageSerializer(many=True) but skips
+    model instantiation and DRF's per-field to_representation loop.
+    
+    Args:
+        queryset: Message queryset (may already be sliced)
+        extra_fields: Annotation names to carry through untouched
+        
+    Returns:
+        List of message dicts ready for the response body
+    """
+    rows = list(queryset.values(*MESSAGE_LIST_FIELDS, *extra_fields).iterator(chunk_size=100))
+    to_datetime = _datetime_field.to_representation
+    
+    for row in rows:
+        row['id'] = str(row['id'])
+        row['conversation_id'] = str(row['conversation_id'])
+        
+        for key in ('sent_at', 'delivered_at', 'created_at'):
+            if row[key] is not None:
+                row[key] = to_datetime(row[key])
+        
+        content = row['content']
+        if content and is_encrypted(content):
+            try:
+                row['content'] = decrypt(content)
+            except Exception as e:
+                logger.warning('[serializer] Failed to decrypt content: %s', e)
+        
+        media_url = row['media_url']
+        if media_url and is_encrypted(media_url):
+            try:
+                row['media_url'] = decrypt(media_url)
+            except Exception as e:
+                logger.warning('[serializer] Failed to decrypt media_url: %s', e)
+    
+    return rows
+
+
 class SendMessageSerializer(serializers.Serializer):
     """Serializer for sending a message"""
     content = serializers.CharField(required=True)
-    message_type = serializers.ChoiceField(
-        choices=['text', 'image', 'video', 'file'],
-        default='text'
-    )
+    message_type = serializers.CharField(default='text')
     media_url = serializers.URLField(required=False, allow_null=True)
+    
+    def validate_message_type(self, value):
+        if value not in Message.MESSAGE_TYPES:
+            raise serializers.ValidationError(f'"{value}" is not a valid choice.')
+        return value
 
 
 class MarkAsReadSerializer(serializers.Serializer):
@@ -4,21 +4,61 @@ Message views (controllers) for message operations.
 Migrated from backend/src/controllers/messageController.ts
 """
 
+import asyncio
 import json
+import logging
+import uuid
 
 import httpx
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import Count, F, Q, Subquery, Sum
+from django.db.models.functions import Greatest
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from django.conf import settings
+from django.core.cache import cache
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import AllowAny
+from adrf.views import APIView as AsyncAPIView
+from asgiref.sync import sync_to_async
 
-from .models import Message
+from .models import Message, PendingOutgoingMessage
 from apps.conversations.models import Conversation
-from apps.oauth.models import ConnectedAccount
-from apps.core.utils.crypto import decrypt, is_encrypted
-from .serializers import MessageSerializer, SendMessageSerializer, MarkAsReadSerializer
+from apps.conversations.serializers import ConversationSerializer
+from apps.core.utils.crypto import decrypt, encrypt, is_encrypted
+from apps.core.utils.executors import cpu_executor
+from apps.platforms.adapters.discord import discord_adapter
+from apps.platforms.adapters.factory import get_adapter
+from apps.platforms.adapters.twitter_cookie import twitter_cookie_adapter
+from apps.telegram.services.client import telegram_user_client
+from apps.websocket.services import websocket_service
+from .serializers import (
+    MessageSerializer,
+    SendMessageSerializer,
+    MarkAsReadSerializer,
+    serialize_message_rows,
+)
+
+logger = logging.getLogger(__name__)
+
+# UnreadCountView is polled by the UI; serve it from cache between writes.
+# Views that change unread state invalidate explicitly, and platform syncs
+# that rewrite unread_count are covered by the short TTL.
+UNREAD_COUNT_CACHE_TIMEOUT = 30  # seconds
+
+
+def _unread_count_cache_key(user_id):
+    return f'unread:{user_id}'
+
+
+def invalidate_unread_count_cache(user_id):
+    """Drop a user's cached unread totals (never fails the request)"""
+    try:
+        cache.delete(_unread_count_cache_key(user_id))
+    except Exception as e:
+        logger.warning('[unread-count] Failed to invalidate cache: %s', e)
 
 
 class MessagesListView(APIView):
@@ -38,29 +78,39 @@ class MessagesListView(APIView):
             user_id = request.user_jwt['user_id']
             since = request.query_params.get('since')
             
-            # Get all conversations for user's connected accounts
-            user_accounts = ConnectedAccount.objects.filter(user_id=user_id, is_active=True)
-            conversations = Conversation.objects.filter(account__in=user_accounts)
-            
-            # Get messages
-            messages_query = Message.objects.filter(conversation__in=conversations)
-            
+            # Validate ?since= up front so a bad value never reaches the DB
+            filters = {}
             if since:
-                from django.utils.dateparse import parse_datetime
-                since_date = parse_datetime(since)
-                if since_date:
-                    messages_query = messages_query.filter(sent_at__gte=since_date)
+                try:
+                    since_date = parse_datetime(since)
+                except ValueError:
+                    since_date = None
+                if not since_date:
+                    return Response(
+                        {'error': 'Invalid "since" timestamp, expected ISO 8601'},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+                filters['sent_at__gte'] = since_date
+            
+            # Get messages across the user's active accounts via a direct JOIN
+            # (no IN (subquery) over conversations); the sent_at range is served
+            # by the (conversation, -sent_at) index
+            messages_query = Message.objects.filter(
+                conversation__account__user_id=user_id,
+                conversation__account__is_active=True,
+                **filters
+            ).order_by('-sent_at')
             
-            messages = messages_query[:100]  # Limit to 100
-            serializer = MessageSerializer(messages, many=True)
+            # Limit to 100; rows are streamed without the queryset result cache
+            messages = serialize_message_rows(messages_query[:100])
             
             return Response({
-                'messages': serializer.data,
-                'count': len(serializer.data)
+                'messages': messages,
+                'count': len(messages)
             })
         
         except Exception as e:
-            print(f'Error fetching messages: {e}')
+            logger.error('Error fetching messages: %s', e)
             return Response({
                 'error': 'Failed to fetch messages',
                 'message': str(e)
@@ -73,6 +123,11 @@ class ConversationMessagesView(APIView):
     
     GET /api/messages/:conversationId
     Migrated from: getConversationMessages() in messageController.ts
+    
+    Pagination:
+    - Keyset: ?before=<sent_at ISO 8601>&before_id=<message uuid>, taken from
+      the previous page's next_cursor. Each page is an index range scan.
+    - Offset (deprecated): ?offset=N, kept for existing clients.
     """
     permission_classes = [AllowAny]
     
@@ -84,6 +139,8 @@ class ConversationMessagesView(APIView):
             user_id = request.user_jwt['user_id']
             limit = int(request.query_params.get('limit', 50))
             offset = int(request.query_params.get('offset', 0))
+            before = request.query_params.get('before')
+            before_id = request.query_params.get('before_id')
             
             # Verify user has access to this conversation
             if not self._verify_conversation_access(user_id, conversation_id):
@@ -92,25 +149,61 @@ class ConversationMessagesView(APIView):
                     status=status.HTTP_403_FORBIDDEN
                 )
             
-            # Get messages
-            messages = Message.objects.filter(
+            # Get messages, with the conversation total folded into the same
+            # SELECT as an uncorrelated scalar subquery (one round trip)
+            total_subquery = Message.objects.filter(
                 conversation_id=conversation_id
-            ).order_by('-sent_at')[offset:offset + limit]
+            ).order_by().values('conversation_id').annotate(
+                total=Count('*')
+            ).values('total')
+            
+            messages_query = Message.objects.filter(
+                conversation_id=conversation_id
+            ).annotate(
+                total_count=Subquery(total_subquery)
+            ).order_by('-sent_at', '-id')
+            
+            if before:
+                cursor_filter = self._build_cursor_filter(before, before_id)
+                if cursor_filter is None:
+                    return Response(
+                        {'error': 'Invalid pagination cursor'},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+                messages_query = messages_query.filter(cursor_filter)[:limit]
+                offset = 0
+            else:
+                messages_query = messages_query[offset:offset + limit]
+            
+            messages = serialize_message_rows(messages_query, extra_fields=('total_count',))
             
-            total_count = Message.objects.filter(conversation_id=conversation_id).count()
+            total_count = 0
+            for row in messages:
+                total_count = row.pop('total_count')
             
-            serializer = MessageSerializer(messages, many=True)
+            if not messages and (before or offset):
+                # Paged past the end - no row to read the total from
+                total_count = Message.objects.filter(conversation_id=conversation_id).count()
+            
+            next_cursor = None
+            if len(messages) == limit:
+                last = messages[-1]
+                next_cursor = {
+                    'before': last['sent_at'],
+                    'before_id': last['id'],
+                }
             
             return Response({
-                'messages': serializer.data,
-                'count': len(serializer.data),
+                'messages': messages,
+                'count': len(messages),
                 'total': total_count,
                 'limit': limit,
-                'offset': offset
+                'offset': offset,
+                'next_cursor': next_cursor,
             })
         
         except Exception as e:
-            print(f'Error fetching conversation messages: {e}')
+            logger.error('Error fetching conversation messages: %s', e)
             return Response({
                 'error': 'Failed to fetch conversation messages',
                 'message': str(e)
@@ -122,10 +215,101 @@ class ConversationMessagesView(APIView):
             id=conversation_id,
             account__user_id=user_id
         ).exists()
+    
+    def _build_cursor_filter(self, before, before_id=None):
+        """
+        Build the keyset predicate for rows older than the cursor position.
+        
+        Returns None if the cursor can't be parsed.
+        """
+        try:
+            before_date = parse_datetime(before)
+        except ValueError:
+            return None
+        if not before_date:
+            return None
+        
+        if not before_id:
+            return Q(sent_at__lt=before_date)
+        
+        try:
+            before_uuid = uuid.UUID(before_id)
+        except ValueError:
+            return None
+        
+        # Ties on sent_at are broken by id, matching the ORDER BY
+        return Q(sent_at__lt=before_date) | Q(sent_at=before_date, id__lt=before_uuid)
+
+
+async def _send_telegram(conversation, content):
+    """Send through the user's Telethon session"""
+    result = await telegram_user_client.send_message(
+        account_id=str(conversation.account.id),
+        chat_id=conversation.platform_conversation_id,
+        text=content
+    )
+    return {
+        'platformMessageId': result.get('id', str(timezone.now().timestamp())),
+        'senderId': 'me',
+        'senderName': 'You',
+        'messageType': 'text',
+        'mediaUrl': None
+    }
 
 
-from adrf.views import APIView as AsyncAPIView
-from asgiref.sync import sync_to_async
+async def _send_twitter(conversation, content):
+    """Send a DM through the cookie-based adapter"""
+    # Twitter needs participant_id (user ID), not conversation_id (twikit needs user ID)
+    recipient_id = conversation.participant_id or conversation.platform_conversation_id
+    return await twitter_cookie_adapter._send_dm(
+        account_id=str(conversation.account.id),
+        conversation_id=recipient_id,
+        content=content
+    )
+
+
+async def _send_discord(conversation, content):
+    """Send a DM through the token-based adapter"""
+    return await sync_to_async(discord_adapter.send_message)(
+        account_id=str(conversation.account.id),
+        conversation_id=conversation.platform_conversation_id,
+        content=content
+    )
+
+
+# Platforms sent directly from the server: platform -> (label, sender)
+DIRECT_SEND_PLATFORMS = {
+    'telegram': ('Telegram', _send_telegram),
+    'twitter': ('Twitter', _send_twitter),
+    'discord': ('Discord', _send_discord),
+}
+
+# Platforms whose APIs are blocked/unreliable from server IPs; these are
+# queued for the Desktop App to send (browser automation / whatsapp-web.js).
+# platform -> (stored platform, label, note)
+DESKTOP_QUEUED_PLATFORMS = {
+    'linkedin': (
+        'linkedin', 'LinkedIn',
+        'Message queued for Desktop App. Make sure Desktop App is running with LinkedIn connected!'
+    ),
+    'instagram': (
+        'instagram', 'Instagram',
+        'Message queued for Desktop App. Make sure Desktop App is running!'
+    ),
+    'whatsapp': (
+        'whatsapp', 'WhatsApp',
+        'Message queued for Desktop App. Make sure Desktop App is running with WhatsApp connected!'
+    ),
+    'facebook': (
+        'facebook', 'Facebook',
+        'Message queued for Desktop App. Make sure Desktop App is running with Facebook connected!'
+    ),
+    'facebook_cookie': (
+        'facebook', 'Facebook',
+        'Message queued for Desktop App. Make sure Desktop App is running with Facebook connected!'
+    ),
+}
+
 
 class SendMessageView(AsyncAPIView):
     """
@@ -143,340 +327,201 @@ class SendMessageView(AsyncAPIView):
             
             user_id = request.user_jwt['user_id']
             
-            # Validate request
-            serializer = SendMessageSerializer(data=request.data)
-            if not serializer.is_valid():
-                return Response({'error': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
-            
-            content = serializer.validated_data['content']
-            
-            # Verify user has access (wrap in sync_to_async for async context)
-            @sync_to_async
-            def get_conversation():
+            # Verify user has access (native async ORM, no thread hop).
+            # The account's token columns are never read here - adapters load
+            # credentials themselves - so leave them out of the SELECT.
+            async def get_conversation():
                 try:
-                    return Conversation.objects.select_related('account').get(
+                    return await Conversation.objects.select_related('account').defer(
+                        'account__access_token',
+                        'account__refresh_token'
+                    ).aget(
                         id=conversation_id,
                         account__user_id=user_id
                     )
                 except Conversation.DoesNotExist:
                     return None
             
-            conversation = await get_conversation()
+            # Start the lookup so it runs while the body is validated
+            conversation_task = asyncio.ensure_future(get_conversation())
+            
+            # Validate request
+            serializer = SendMessageSerializer(data=request.data)
+            if not serializer.is_valid():
+                conversation_task.cancel()
+                return Response({'error': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+            
+            content = serializer.validated_data['content']
+            
+            conversation = await conversation_task
             if not conversation:
                 return Response(
                     {'error': 'Conversation not found or access denied'},
                     status=status.HTTP_404_NOT_FOUND
                 )
             
-            # Send message through Telethon for Telegram
-            from apps.core.utils.crypto import encrypt
-            from django.utils import timezone
+            platform = conversation.account.platform
             
-            if conversation.account.platform == 'telegram':
-                # Use Telethon client
-                from apps.telegram.services.client import telegram_user_client
-                
-                try:
-                    result = await telegram_user_client.send_message(
-                        account_id=str(conversation.account.id),
-                        chat_id=conversation.platform_conversation_id,
-                        text=content
-                    )
-                    sent_msg = {
-                        'platformMessageId': result.get('id', str(timezone.now().timestamp())),
-                        'senderId': 'me',
-                        'senderName': 'You',
-                        'messageType': 'text',
-                        'mediaUrl': None
-                    }
-                except Exception as telegram_err:
-                    print(f'[send-message] Telegram send failed: {telegram_err}')
-                    import traceback
-                    traceback.print_exc()
-                    return Response({
-                        'error': f'Failed to send message via Telegram: {str(telegram_err)}',
-                    }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-            elif conversation.account.platform == 'twitter':
-                # Use cookie-based adapter for Twitter DMs (async)
-                # Twitter needs participant_id (user ID), not conversation_id
-                from apps.platforms.adapters.twitter_cookie import twitter_cookie_adapter
-                try:
-                    # Use participant_id for Twitter DMs (twikit needs user ID)
-                    recipient_id = conversation.participant_id or conversation.platform_conversation_id
-                    sent_msg = await twitter_cookie_adapter._send_dm(
-                        account_id=str(conversation.account.id),
-                        conversation_id=recipient_id,
-                        content=content
-                    )
-                except Exception as twitter_err:
-                    print(f'[send-message] Twitter send failed: {twitter_err}')
-                    import traceback
-                    traceback.print_exc()
-                    return Response({
-                        'error': f'Failed to send message via Twitter: {str(twitter_err)}',
-                    }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-            elif conversation.account.platform == 'linkedin':
-                # LinkedIn: Queue message for Desktop App to send (uses browser automation)
-                # LinkedIn's API from server IPs is blocked/unreliable, so we use Desktop App
-                from .models import PendingOutgoingMessage
-                import uuid
-                from django.utils import timezone
-                
-                try:
-                    # Create pending message for Desktop App to send
-                    pending_msg = await sync_to_async(PendingOutgoingMessage.objects.create)(
-                        id=uuid.uuid4(),
-                        user_id=user_id,
-                        account=conversation.account,
-                        conversation=conversation,
-                        platform='linkedin',
-                        platform_conversation_id=conversation.platform_conversation_id,
-                        recipient_id=conversation.participant_id or '',
-                        content=content,
-                        status='pending'
-                    )
-                    
-                    print(f'[send-message] LinkedIn message queued for Desktop App: {pending_msg.id}')
-                    
-                    # Return 202 Accepted with pending info
-                    return Response({
-                        'success': True,
-                        'message': {
-                            'id': str(pending_msg.id),
-                            'content': content,
-                            'senderName': 'You',
-                            'isOutgoing': True,
-                            'sentAt': timezone.now().isoformat(),
-                            'status': 'pending',
-                        },
-                        'pendingId': str(pending_msg.id),
-                        'note': 'Message queued for Desktop App. Make sure Desktop App is running with LinkedIn connected!',
-                    }, status=status.HTTP_202_ACCEPTED)
-                    
-                except Exception as linkedin_err:
-                    print(f'[send-message] LinkedIn queue failed: {linkedin_err}')
-                    import traceback
-                    traceback.print_exc()
-                    return Response({
-                        'error': f'Failed to queue LinkedIn message: {str(linkedin_err)}',
-                    }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-            elif conversation.account.platform == 'instagram':
-                # Instagram: Queue message for Desktop App to send (server IP is blocked by Instagram)
-                from .models import PendingOutgoingMessage
-                import uuid
-                from django.utils import timezone
-                
-                try:
-                    # Create pending message for Desktop App to send
-                    pending_msg = await sync_to_async(PendingOutgoingMessage.objects.create)(
-                        id=uuid.uuid4(),
-                        user_id=user_id,
-                        account=conversation.account,
-                        conversation=conversation,
-                        platform='instagram',
-                        platform_conversation_id=conversation.platform_conversation_id,
-                        recipient_id=conversation.participant_id or '',
-                        content=content,
-                        status='pending'
-                    )
-                    
-                    print(f'[send-message] Instagram message queued for Desktop App: {pending_msg.id}')
-                    
-                    # Return 202 Accepted with pending info
-                    return Response({
-                        'success': True,
-                        'message': {
-                            'id': str(pending_msg.id),
-                            'content': content,
-                            'senderName': 'You',
-                            'isOutgoing': True,
-                            'sentAt': timezone.now().isoformat(),
-                            'status': 'pending',
-                        },
-                        'pendingId': str(pending_msg.id),
-                        'note': 'Message queued for Desktop App. Make sure Desktop App is running!',
-                    }, status=status.HTTP_202_ACCEPTED)
-                    
-                except Exception as insta_err:
-                    print(f'[send-message] Instagram queue failed: {insta_err}')
-                    import traceback
-                    traceback.print_exc()
-                    return Response({
-                        'error': f'Failed to queue Instagram message: {str(insta_err)}',
-                    }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-            elif conversation.account.platform == 'whatsapp':
-                # WhatsApp: Queue message for Desktop App to send (uses whatsapp-web.js on desktop)
-                from .models import PendingOutgoingMessage
-                import uuid
-                from django.utils import timezone
-                
-                try:
-                    # Create pending message for Desktop App to send
-                    pending_msg = await sync_to_async(PendingOutgoingMessage.objects.create)(
-                        id=uuid.uuid4(),
-                        user_id=user_id,
-                        account=conversation.account,
-                        conversation=conversation,
-                        platform='whatsapp',
-                        platform_conversation_id=conversation.platform_conversation_id,
-                        recipient_id=conversation.participant_id or '',
-                        content=content,
-                        status='pending'
-                    )
-                    
-                    print(f'[send-message] WhatsApp message queued for Desktop App: {pending_msg.id}')
-                    
-                    # Return 202 Accepted with pending info
-                    return Response({
-                        'success': True,
-                        'message': {
-                            'id': str(pending_msg.id),
-                            'content': content,
-                            'senderName': 'You',
-                            'isOutgoing': True,
-                            'sentAt': timezone.now().isoformat(),
-                            'status': 'pending',
-                        },
-                        'pendingId': str(pending_msg.id),
-                        'note': 'Message queued for Desktop App. Make sure Desktop App is running with WhatsApp connected!',
-                    }, status=status.HTTP_202_ACCEPTED)
-                    
-                except Exception as whatsapp_err:
-                    print(f'[send-message] WhatsApp queue failed: {whatsapp_err}')
-                    import traceback
-                    traceback.print_exc()
-                    return Response({
-                        'error': f'Failed to queue WhatsApp message: {str(whatsapp_err)}',
-                    }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-            elif conversation.account.platform == 'discord':
-                # Discord: Use token-based adapter for sending DMs
-                from apps.platforms.adapters.discord import discord_adapter
+            queued = DESKTOP_QUEUED_PLATFORMS.get(platform)
+            if queued:
+                queued_platform, label, note = queued
+                return await self._queue_for_desktop(
+                    user_id, conversation, content,
+                    platform=queued_platform,
+                    label=label,
+                    note=note
+                )
+            
+            direct = DIRECT_SEND_PLATFORMS.get(platform)
+            if direct:
+                label, send = direct
                 try:
-                    sent_msg = await sync_to_async(discord_adapter.send_message)(
-                        account_id=str(conversation.account.id),
-                        conversation_id=conversation.platform_conversation_id,
-                        content=content
-                    )
-                except Exception as discord_err:
-                    print(f'[send-message] Discord send failed: {discord_err}')
-                    import traceback
-                    traceback.print_exc()
+                    sent_msg = await send(conversation, content)
+                except Exception as send_err:
+                    logger.exception('[send-message] %s send failed: %s', label, send_err)
                     return Response({
-                        'error': f'Failed to send message via Discord: {str(discord_err)}',
-                    }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-            elif conversation.account.platform in ['facebook', 'facebook_cookie']:
-                # Facebook: Queue message for Desktop App to send (uses browser automation)
-                from .models import PendingOutgoingMessage
-                import uuid
-                from django.utils import timezone
-                
-                try:
-                    # Create pending message for Desktop App to send
-                    pending_msg = await sync_to_async(PendingOutgoingMessage.objects.create)(
-                        id=uuid.uuid4(),
-                        user_id=user_id,
-                        account=conversation.account,
-                        conversation=conversation,
-                        platform='facebook',
-                        platform_conversation_id=conversation.platform_conversation_id,
-                        recipient_id=conversation.participant_id or '',
-                        content=content,
-                        status='pending'
-                    )
-                    
-                    print(f'[send-message] Facebook message queued for Desktop App: {pending_msg.id}')
-                    
-                    # Return 202 Accepted with pending info
-                    return Response({
-                        'success': True,
-                        'message': {
-                            'id': str(pending_msg.id),
-                            'content': content,
-                            'senderName': 'You',
-                            'isOutgoing': True,
-                            'sentAt': timezone.now().isoformat(),
-                            'status': 'pending',
-                        },
-                        'pendingId': str(pending_msg.id),
-                        'note': 'Message queued for Desktop App. Make sure Desktop App is running with Facebook connected!',
-                    }, status=status.HTTP_202_ACCEPTED)
-                    
-                except Exception as facebook_err:
-                    print(f'[send-message] Facebook queue failed: {facebook_err}')
-                    import traceback
-                    traceback.print_exc()
-                    return Response({
-                        'error': f'Failed to queue Facebook message: {str(facebook_err)}',
+                        'error': f'Failed to send message via {label}: {str(send_err)}',
                     }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
             else:
                 # Use adapter for other platforms (wrap in sync_to_async)
-                from apps.platforms.adapters.factory import get_adapter
-                adapter = get_adapter(conversation.account.platform)
+                adapter = get_adapter(platform)
                 sent_msg = await sync_to_async(adapter.send_message)(
                     account_id=str(conversation.account.id),
                     conversation_id=conversation.platform_conversation_id,
                     content=content
                 )
             
-            # Create message object with encrypted content (wrap in sync_to_async)
+            sent_at = timezone.now()
+            # Serialize the conversation as it will look after the write
+            conversation.last_message_at = sent_at
+            conversation.updated_at = sent_at
+            
+            # Encrypt on the CPU pool so the ORM thread only does DB I/O
+            loop = asyncio.get_running_loop()
+            media_url = sent_msg.get('mediaUrl')
+            encrypt_jobs = [loop.run_in_executor(cpu_executor, encrypt, content)]
+            if media_url:
+                encrypt_jobs.append(loop.run_in_executor(cpu_executor, encrypt, media_url))
+            encrypted_content, *encrypted_media = await asyncio.gather(*encrypt_jobs)
+            encrypted_media_url = encrypted_media[0] if encrypted_media else None
+            
+            # Create message object with encrypted content. Stays a sync block:
+            # transaction.atomic() isn't available to the async ORM methods
             @sync_to_async
             def save_message_to_db():
                 try:
-                    msg = Message.objects.create(
-                        conversation=conversation,
-                        platform_message_id=str(sent_msg.get('platformMessageId', '') or timezone.now().timestamp()),
-                        sender_id=str(sent_msg.get('senderId', 'me') or 'me'),
-                        sender_name=str(sent_msg.get('senderName', 'You') or 'You'),
-                        content=encrypt(content),
-                        message_type=sent_msg.get('messageType', 'text') or 'text',
-                        media_url=encrypt(sent_msg.get('mediaUrl')) if sent_msg.get('mediaUrl') else None,
-                        is_outgoing=True,
-                        is_read=True,
-                        sent_at=timezone.now()
-                    )
-                    
-                    # Update conversation
-                    conversation.last_message_at = msg.sent_at
-                    conversation.save()
+                    # Message insert and conversation bump commit together
+                    with transaction.atomic():
+                        msg = Message.objects.create(
+                            conversation=conversation,
+                            platform_message_id=str(sent_msg.get('platformMessageId', '') or sent_at.timestamp()),
+                            sender_id=str(sent_msg.get('senderId', 'me') or 'me'),
+                            sender_name=str(sent_msg.get('senderName', 'You') or 'You'),
+                            content=encrypted_content,
+                            message_type=sent_msg.get('messageType', 'text') or 'text',
+                            media_url=encrypted_media_url,
+                            is_outgoing=True,
+                            is_read=True,
+                            sent_at=sent_at
+                        )
+                        
+                        # Update conversation (narrow UPDATE, no model save/signals)
+                        Conversation.objects.filter(pk=conversation.pk).update(
+                            last_message_at=sent_at,
+                            updated_at=sent_at
+                        )
                     
                     return msg
                 except Exception as db_err:
-                    print(f'[send-message] DB save failed: {db_err}')
-                    import traceback
-                    traceback.print_exc()
+                    logger.exception('[send-message] DB save failed: %s', db_err)
                     raise
             
-            message = await save_message_to_db()
-            serializer = MessageSerializer(message)
-            
-            # Emit WebSocket event for real-time update
-            from apps.websocket.services import websocket_service
-            from apps.conversations.serializers import ConversationSerializer
-            
-            @sync_to_async
+            # No DB access (account is select_related), so it can run on its
+            # own thread while the save holds the thread-sensitive one
+            @sync_to_async(thread_sensitive=False)
             def get_conversation_data():
                 return ConversationSerializer(conversation).data
             
-            conv_data = await get_conversation_data()
-            
-            await websocket_service.emit_new_message_async(
-                user_id=user_id,
-                message=serializer.data,
-                conversation=conv_data
+            message, conv_data = await asyncio.gather(
+                save_message_to_db(),
+                get_conversation_data()
+            )
+            message_data = MessageSerializer(message).data
+            
+            # Emit WebSocket event for real-time update once the write has
+            # committed, without holding the HTTP response on socket I/O
+            websocket_service.run_in_background(
+                websocket_service.emit_new_message_async(
+                    user_id=user_id,
+                    message=message_data,
+                    conversation=conv_data
+                )
             )
             
             return Response({
-                'message': serializer.data,
+                'message': message_data,
                 'success': True
             }, status=status.HTTP_201_CREATED)
         
         except Exception as e:
-            print(f'Error sending message: {e}')
+            logger.error('Error sending message: %s', e)
             return Response({
                 'error': 'Failed to send message',
                 'message': str(e)
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
+    
+    async def _queue_for_desktop(self, user_id, conversation, content, platform, label, note):
+        """
+        Queue an outgoing message for the Desktop App to send.
+        
+        Used for platforms whose APIs are blocked from server IPs; the
+        Desktop App polls for pending rows and sends them itself.
+        
+        Returns:
+            202 Response with the pending message, or 500 if it couldn't be queued
+        """
+        try:
+            # Stored encrypted like Message.content; the Desktop App poll
+            # endpoints decrypt it via PendingOutgoingMessage.plain_content
+            loop = asyncio.get_running_loop()
+            encrypted_content = await loop.run_in_executor(cpu_executor, encrypt, content)
+            
+            # Build in Python and INSERT once; nothing needs to be read back
+            pending_msg = PendingOutgoingMessage(
+                id=uuid.uuid4(),
+                user_id=user_id,
+                account=conversation.account,
+                conversation=conversation,
+                platform=platform,
+                platform_conversation_id=conversation.platform_conversation_id,
+                recipient_id=conversation.participant_id or '',
+                content=encrypted_content,
+                status='pending'
+            )
+            await pending_msg.asave(force_insert=True)
+            
+            logger.info('[send-message] %s message queued for Desktop App: %s', label, pending_msg.id)
+            
+            # Return 202 Accepted with pending info
+            return Response({
+                'success': True,
+                'message': {
+                    'id': str(pending_msg.id),
+                    'content': content,
+                    'senderName': 'You',
+                    'isOutgoing': True,
+                    'sentAt': timezone.now().isoformat(),
+                    'status': 'pending',
+                },
+                'pendingId': str(pending_msg.id),
+                'note': note,
+            }, status=status.HTTP_202_ACCEPTED)
+        
+        except Exception as queue_err:
+            logger.exception('[send-message] %s queue failed: %s', label, queue_err)
+            return Response({
+                'error': f'Failed to queue {label} message: {str(queue_err)}',
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 class ChatAIAssistView(APIView):
     """
@@ -607,7 +652,7 @@ class ChatAIAssistView(APIView):
             })
 
         except Exception as e:
-            print(f'Error in AI assist: {e}')
+            logger.error('Error in AI assist: %s', e)
             return Response({
                 'error': 'Failed to generate AI response',
                 'message': str(e)
@@ -671,26 +716,33 @@ class MarkMessageReadView(APIView):
             
             user_id = request.user_jwt['user_id']
             
-            # Get message
-            try:
-                message = Message.objects.select_related('conversation__account').get(
-                    id=message_id,
-                    conversation__account__user_id=user_id
-                )
-            except Message.DoesNotExist:
+            # Get message (only the keys needed for the UPDATEs below)
+            message = Message.objects.filter(
+                id=message_id,
+                conversation__account__user_id=user_id
+            ).values('id', 'conversation_id').first()
+            
+            if not message:
                 return Response(
                     {'error': 'Message not found or access denied'},
                     status=status.HTTP_404_NOT_FOUND
                 )
             
-            # Mark as read
-            message.is_read = True
-            message.save()
-            
-            # Update conversation unread count
-            conversation = message.conversation
-            conversation.unread_count = max(0, conversation.unread_count - 1)
-            conversation.save()
+            # Mark as read and decrement the conversation counter in SQL, so
+            # concurrent ingestion/mark-read can't lose updates. Only a row that
+            # actually flips from unread counts, making repeat calls idempotent.
+            with transaction.atomic():
+                flipped = Message.objects.filter(
+                    pk=message['id'],
+                    is_read=False
+                ).update(is_read=True)
+                
+                if flipped:
+                    Conversation.objects.filter(pk=message['conversation_id']).update(
+                        unread_count=Greatest(F('unread_count') - 1, 0),
+                        updated_at=timezone.now()
+                    )
+                    transaction.on_commit(lambda: invalidate_unread_count_cache(user_id))
             
             return Response({
                 'success': True,
@@ -698,7 +750,7 @@ class MarkMessageReadView(APIView):
             })
         
         except Exception as e:
-            print(f'Error marking message as read: {e}')
+            logger.error('Error marking message as read: %s', e)
             return Response({
                 'error': 'Failed to mark message as read',
                 'message': str(e)
@@ -721,28 +773,31 @@ class MarkConversationReadView(APIView):
             
             user_id = request.user_jwt['user_id']
             
-            # Verify access
-            try:
-                conversation = Conversation.objects.get(
+            with transaction.atomic():
+                # Reset unread count; the ownership filter doubles as the
+                # access check, so there is no separate SELECT to race with
+                updated = Conversation.objects.filter(
                     id=conversation_id,
                     account__user_id=user_id
+                ).update(
+                    unread_count=0,
+                    updated_at=timezone.now()
                 )
-            except Conversation.DoesNotExist:
-                return Response(
-                    {'error': 'Conversation not found or access denied'},
-                    status=status.HTTP_404_NOT_FOUND
-                )
-            
-            # Mark all messages as read
-            Message.objects.filter(
-                conversation=conversation,
-                is_read=False,
-                is_outgoing=False
-            ).update(is_read=True)
-            
-            # Reset unread count
-            conversation.unread_count = 0
-            conversation.save()
+                
+                if not updated:
+                    return Response(
+                        {'error': 'Conversation not found or access denied'},
+                        status=status.HTTP_404_NOT_FOUND
+                    )
+                
+                # Mark all messages as read
+                Message.objects.filter(
+                    conversation_id=conversation_id,
+                    is_read=False,
+                    is_outgoing=False
+                ).update(is_read=True)
+                
+                transaction.on_commit(lambda: invalidate_unread_count_cache(user_id))
             
             return Response({
                 'success': True,
@@ -750,7 +805,7 @@ class MarkConversationReadView(APIView):
             })
         
         except Exception as e:
-            print(f'Error marking conversation as read: {e}')
+            logger.error('Error marking conversation as read: %s', e)
             return Response({
                 'error': 'Failed to mark conversation as read',
                 'message': str(e)
@@ -772,29 +827,44 @@ class UnreadCountView(APIView):
                 return Response({'error': 'Unauthorized'}, status=status.HTTP_401_UNAUTHORIZED)
             
             user_id = request.user_jwt['user_id']
+            cache_key = _unread_count_cache_key(user_id)
             
-            # Get total unread count
-            user_accounts = ConnectedAccount.objects.filter(user_id=user_id, is_active=True)
-            conversations = Conversation.objects.filter(account__in=user_accounts)
-            
-            total_unread = sum(conv.unread_count for conv in conversations)
-            
-            # Get unread by platform
-            by_platform = {}
-            for account in user_accounts:
-                platform = account.platform
-                platform_conversations = conversations.filter(account=account)
-                platform_unread = sum(conv.unread_count for conv in platform_conversations)
-                if platform_unread > 0:
-                    by_platform[platform] = platform_unread
-            
-            return Response({
+            try:
+                cached = cache.get(cache_key)
+            except Exception as e:
+                logger.warning('[unread-count] Cache read failed: %s', e)
+                cached = None
+            if cached is not None:
+                return Response(cached)
+            
+            # Unread by platform in one round trip
+            # (GROUP BY platform HAVING SUM(unread_count) > 0)
+            platform_rows = Conversation.objects.filter(
+                account__user_id=user_id,
+                account__is_active=True
+            ).values('account__platform').annotate(
+                unread=Sum('unread_count')
+            ).filter(unread__gt=0)
+            by_platform = {row['account__platform']: row['unread'] for row in platform_rows}
+            
+            # Platforms with nothing unread contribute 0, so the total is the
+            # sum of the grouped rows - no second query needed
+            total_unread = sum(by_platform.values())
+            
+            payload = {
                 'total': total_unread,
                 'byPlatform': by_platform
-            })
+            }
+            
+            try:
+                cache.set(cache_key, payload, timeout=UNREAD_COUNT_CACHE_TIMEOUT)
+            except Exception as e:
+                logger.warning('[unread-count] Cache write failed: %s', e)
+            
+            return Response(payload)
         
         except Exception as e:
-            print(f'Error fetching unread count: {e}')
+            logger.error('Error fetching unread count: %s', e)
             return Response({
                 'error': 'Failed to fetch unread count',
                 'message': str(e)
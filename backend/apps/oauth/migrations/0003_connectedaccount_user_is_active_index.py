@@ -0,0 +1,17 @@
+# Generated by Django 5.0 on 2026-10-16 18:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('oauth', '0002_add_pending_outgoing_message'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='connectedaccount',
+            index=models.Index(fields=['user', 'is_active'], name='connected_a_user_id_e85792_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0 on 2026-10-16 19:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('oauth', '0003_connectedaccount_user_is_active_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='connectedaccount',
+            index=models.Index(fields=['platform', 'platform_user_id'], name='ca_platform_uid'),
+        ),
+        migrations.AddIndex(
+            model_name='connectedaccount',
+            index=models.Index(fields=['user', 'is_active', '-created_at'], name='ca_user_active_created'),
+        ),
+        migrations.RemoveIndex(
+            model_name='connectedaccount',
+            name='connected_a_user_id_a60e05_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='connectedaccount',
+            name='connected_a_platfor_ff48b7_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='connectedaccount',
+            name='connected_a_user_id_e85792_idx',
+        ),
+    ]
@@ -6,9 +6,23 @@ Migrated from backend/db/init.sql - connected_accounts table
 
 import uuid
 from django.db import models
+from django.db.models.functions import Now
+from django.utils import timezone
 from apps.authentication.models import User
 
 
+class ConnectedAccountQuerySet(models.QuerySet):
+    """QuerySet helpers for ConnectedAccount"""
+    
+    def with_user(self):
+        """Join the owning user (for callers that display accounts)"""
+        return self.select_related('user')
+    
+    def expired(self):
+        """Accounts whose access token has expired (compared in SQL)"""
+        return self.filter(token_expires_at__isnull=False, token_expires_at__lte=Now())
+
+
 class ConnectedAccount(models.Model):
     """
     Connected platform account model
@@ -44,22 +58,28 @@ class ConnectedAccount(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = ConnectedAccountQuerySet.as_manager()
+    
     class Meta:
         db_table = 'connected_accounts'
         unique_together = ['user', 'platform', 'platform_user_id']
+        # `user` is already indexed as a ForeignKey and leads the unique key
         indexes = [
-            models.Index(fields=['user']),
-            models.Index(fields=['platform']),
+            # Webhook account resolution: platform + platform_user_id
+            models.Index(fields=['platform', 'platform_user_id'], name='ca_platform_uid'),
+            # Active-account filters and joins, newest first
+            models.Index(fields=['user', 'is_active', '-created_at'], name='ca_user_active_created'),
         ]
         ordering = ['-created_at']
     
     def __str__(self):
-        return f'{self.user.email} - {self.get_platform_display()}'
+        # Only use the email if the user was joined; don't query per row
+        owner = self.user.email if ConnectedAccount.user.is_cached(self) else self.user_id
+        return f'{owner} - {self.get_platform_display()}'
     
     @property
     def is_token_expired(self):
         """Check if access token is expired"""
         if not self.token_expires_at:
             return False
-        from django.utils import timezone
         return timezone.now() >= self.token_expires_at
@@ -4,33 +4,163 @@ Base OAuth service providing common OAuth 2.0 flow functionality.
 Migrated from backend/src/services/oauth/OAuthBaseService.ts
 """
 
+import logging
+import random
 import time
 from abc import ABC, abstractmethod
 from typing import Optional, Dict
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import cached_property
 from datetime import datetime, timedelta
-from urllib.parse import urlencode
+from urllib.parse import quote_plus, urlencode, urlsplit
 
 import requests
+from redis.exceptions import LockError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from django.core.cache import cache
 from django.db import transaction
 from django.utils import timezone
 
 from apps.core.utils.crypto import encrypt, decrypt
 from apps.oauth.models import ConnectedAccount
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Graph API user tokens living longer than this are already long-lived
+# (~60 days), so the fb_exchange_token round trip can be skipped
+LONG_LIVED_TOKEN_MIN_EXPIRY = 30 * 24 * 3600
+
+# ensure_valid_token() refreshes tokens expiring within this window
+TOKEN_EXPIRY_BUFFER = timedelta(minutes=5)
+
+# Per-account refresh lock, so concurrent requests and the background task
+# never spend the same refresh token twice (providers that rotate refresh
+# tokens invalidate the loser's). The timeout outlives one refresh with all
+# of its retries: 3 attempts at SLOW_HTTP_TIMEOUT (~33s each) plus at most
+# MAX_RETRY_SLEEP between them.
+REFRESH_LOCK_TIMEOUT = 150
+REFRESH_LOCK_WAIT = 20
+
+# (connect, read) timeouts for provider calls: an unreachable host fails in
+# ~3s instead of using up the whole read budget
+HTTP_TIMEOUT = (3.05, 10)
+SLOW_HTTP_TIMEOUT = (3.05, 30)
+
+# Longest a token refresh sleeps between attempts, whatever a provider's
+# Retry-After asks for; the refresh lock is held while it waits
+MAX_RETRY_SLEEP = 10
+
+# One keep-alive pool shared by every OAuth service so consecutive calls to
+# a provider reuse the TCP+TLS connection. The adapter retries connection
+# failures, and 429/5xx only for GETs; POSTs to token endpoints aren't
+# idempotent (an authorization code is single use), so the services retry
+# those themselves. Content-Type and timeout are passed per request
+# (Session has no default timeout).
+http_session = requests.Session()
+http_session.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({'GET'}),
+        raise_on_status=False
+    )
+))
+
+
+class _CacheAddLock:
+    """
+    Minimal lock on cache.add() for cache backends without lock()
+    
+    Unlike the Redis lock it isn't owner-checked on release; it only
+    exists so non-Redis setups (tests, local development) still work.
+    """
+    
+    def __init__(self, key: str):
+        self.key = key
+    
+    def acquire(self, wait: float) -> bool:
+        deadline = time.monotonic() + wait
+        while not cache.add(self.key, 1, REFRESH_LOCK_TIMEOUT):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.2)
+        return True
+    
+    def release(self) -> None:
+        cache.delete(self.key)
+
+
+def acquire_refresh_lock(account_id, wait: float = 0):
+    """
+    Take the token refresh lock for an account
+    
+    Uses django-redis' cache.lock(), a redis-py Lock holding a unique owner
+    token, so a worker whose lock expired mid-refresh can't release the
+    lock another worker has since taken.
+    
+    Args:
+        account_id: Connected account ID
+        wait: Seconds to keep retrying while another worker holds the lock
+        
+    Returns:
+        The lock (pass it to release_refresh_lock()), or None if it is
+        held elsewhere
+    """
+    key = f'oauth:refresh:{account_id}'
+    
+    if hasattr(cache, 'lock'):
+        lock = cache.lock(key, timeout=REFRESH_LOCK_TIMEOUT, blocking_timeout=wait)
+        acquired = lock.acquire(blocking=wait > 0)
+    else:
+        lock = _CacheAddLock(key)
+        acquired = lock.acquire(wait)
+    
+    return lock if acquired else None
+
+
+def release_refresh_lock(lock) -> None:
+    """Release a lock returned by acquire_refresh_lock()"""
+    try:
+        lock.release()
+    except LockError as e:
+        # Expired (and possibly re-taken) while we held it
+        logger.warning('Token refresh lock was lost before release: %s', e)
+
+
+@dataclass(slots=True, frozen=True)
 class OAuthConfig:
-    """OAuth configuration"""
+    """
+    OAuth configuration
+    
+    Validated once when the service singletons are created at import, so a
+    malformed endpoint fails at startup rather than on a user's first
+    connect attempt.
+    """
     client_id: str
     client_secret: str
     redirect_uri: str
     authorization_url: str
     token_url: str
     scopes: list
+    
+    def __post_init__(self):
+        # Provider endpoints carry client secrets and codes: HTTPS only.
+        # token_url may be empty for platforms without a token endpoint.
+        for name in ('authorization_url', 'token_url'):
+            url = getattr(self, name)
+            if url and urlsplit(url).scheme != 'https':
+                raise ValueError(f'OAuth {name} must be an https:// URL: {url!r}')
+        
+        parts = urlsplit(self.redirect_uri)
+        if parts.scheme not in ('http', 'https') or not parts.netloc:
+            raise ValueError(f'OAuth redirect_uri must be an absolute URL: {self.redirect_uri!r}')
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OAuthTokens:
     """OAuth tokens"""
     access_token: str
@@ -39,7 +169,7 @@ class OAuthTokens:
     token_type: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StoredTokenData:
     """Stored token data"""
     access_token: str
@@ -55,6 +185,14 @@ class OAuthBaseService(ABC):
     Migrated from: OAuthBaseService in OAuthBaseService.ts
     """
     
+    # Set by services whose provider has a revocation endpoint (called from
+    # revoke_access_token())
+    revokes_tokens = False
+    
+    # Fixed platform-specific authorization URL parameters, encoded once
+    # with the standard ones
+    authorization_params: Dict[str, str] = {}
+    
     def __init__(self, platform: str, config: OAuthConfig):
         """
         Initialize OAuth service
@@ -65,11 +203,38 @@ class OAuthBaseService(ABC):
         """
         self.platform = platform
         self.config = config
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Content-Type': 'application/json'
+        
+        # The standard authorization params never change for a service;
+        # encode them once and only append state per request
+        base_params = urlencode({
+            'client_id': config.client_id,
+            'redirect_uri': config.redirect_uri,
+            'response_type': 'code',
+            'scope': self.scope_string,
+            **self.authorization_params,
         })
-        self.session.timeout = 10
+        self._authorization_base_url = f"{config.authorization_url}?{base_params}"
+        
+        # Static fields of the token endpoint form bodies; each call only
+        # adds its code/refresh_token
+        self._exchange_body = {
+            'client_id': config.client_id,
+            'client_secret': config.client_secret,
+            'redirect_uri': config.redirect_uri,
+            'grant_type': 'authorization_code',
+        }
+        self._refresh_body = {
+            'client_id': config.client_id,
+            'client_secret': config.client_secret,
+            'grant_type': 'refresh_token',
+        }
+        
+        self.session = http_session
+    
+    @cached_property
+    def scope_string(self) -> str:
+        """Space-delimited scopes, as sent in authorization and token requests"""
+        return ' '.join(self.config.scopes)
     
     def generate_authorization_url(
         self, 
@@ -84,22 +249,17 @@ class OAuthBaseService(ABC):
         Args:
             state: Random state parameter for CSRF protection
             additional_params: Platform-specific additional parameters
+                (appended; must not repeat the standard parameters)
             
         Returns:
             Authorization URL
         """
-        params = {
-            'client_id': self.config.client_id,
-            'redirect_uri': self.config.redirect_uri,
-            'response_type': 'code',
-            'scope': ' '.join(self.config.scopes),
-            'state': state,
-        }
+        url = f"{self._authorization_base_url}&state={quote_plus(state)}"
         
         if additional_params:
-            params.update(additional_params)
+            url = f"{url}&{urlencode(additional_params)}"
         
-        return f"{self.config.authorization_url}?{urlencode(params)}"
+        return url
     
     def exchange_code_for_token(
         self, 
@@ -122,13 +282,7 @@ class OAuthBaseService(ABC):
             Exception: If token exchange fails
         """
         try:
-            data = {
-                'client_id': self.config.client_id,
-                'client_secret': self.config.client_secret,
-                'code': code,
-                'redirect_uri': self.config.redirect_uri,
-                'grant_type': 'authorization_code',
-            }
+            data = {**self._exchange_body, 'code': code}
             
             if additional_params:
                 data.update(additional_params)
@@ -136,7 +290,8 @@ class OAuthBaseService(ABC):
             response = self.session.post(
                 self.config.token_url,
                 data=data,
-                headers={'Content-Type': 'application/x-www-form-urlencoded'}
+                headers={'Content-Type': 'application/x-www-form-urlencoded'},
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             
@@ -144,14 +299,14 @@ class OAuthBaseService(ABC):
         
         except requests.RequestException as e:
             error_msg = str(e)
-            if hasattr(e.response, 'json'):
+            response = getattr(e, 'response', None)
+            if response is not None and response.content:
                 try:
-                    error_data = e.response.json()
-                    error_msg = error_data.get('error_description', str(e))
-                except:
-                    pass
+                    error_msg = response.json().get('error_description') or error_msg
+                except (ValueError, AttributeError):
+                    pass  # Not a JSON object; keep the transport error
             
-            print(f'[{self.platform}] Token exchange failed: {error_msg}')
+            logger.error('[%s] Token exchange failed: %s', self.platform, error_msg)
             raise Exception(f'Failed to exchange authorization code: {error_msg}')
     
     def refresh_access_token(
@@ -181,12 +336,7 @@ class OAuthBaseService(ABC):
         
         for retry in range(max_retries):
             try:
-                data = {
-                    'client_id': self.config.client_id,
-                    'client_secret': self.config.client_secret,
-                    'refresh_token': refresh_token,
-                    'grant_type': 'refresh_token',
-                }
+                data = {**self._refresh_body, 'refresh_token': refresh_token}
                 
                 if additional_params:
                     data.update(additional_params)
@@ -194,20 +344,28 @@ class OAuthBaseService(ABC):
                 response = self.session.post(
                     self.config.token_url,
                     data=data,
-                    headers={'Content-Type': 'application/x-www-form-urlencoded'}
+                    headers={'Content-Type': 'application/x-www-form-urlencoded'},
+                    timeout=HTTP_TIMEOUT
                 )
                 response.raise_for_status()
                 
                 return self.parse_token_response(response.json())
             
             except requests.RequestException as e:
-                print(f'[{self.platform}] Token refresh attempt {retry + 1}/{max_retries} failed: {e}')
+                logger.warning('[%s] Token refresh attempt %d/%d failed: %s', self.platform, retry + 1, max_retries, e)
+                
+                # 4xx (invalid_grant, revoked consent, ...) won't succeed on
+                # retry; 429 is the exception
+                status_code = getattr(e.response, 'status_code', None)
+                if status_code is not None and 400 <= status_code < 500 and status_code != 429:
+                    raise Exception(f'Failed to refresh token: {e}')
                 
                 if retry >= max_retries - 1:
                     raise Exception(f'Failed to refresh token after {max_retries} attempts: {e}')
                 
-                # Exponential backoff: 1s, 2s, 4s
-                time.sleep(2 ** retry)
+                # Capped exponential backoff with full jitter, so workers
+                # don't retry in lockstep after a provider blip
+                time.sleep(random.uniform(0, min(2, 2 ** retry)))
         
         raise Exception('Token refresh failed')
     
@@ -233,17 +391,6 @@ class OAuthBaseService(ABC):
         Returns:
             Connected account ID
         """
-        # Encrypt tokens before storage
-        encrypted_access_token = encrypt(tokens.access_token)
-        encrypted_refresh_token = (
-            encrypt(tokens.refresh_token) if tokens.refresh_token else None
-        )
-        
-        # Calculate token expiry
-        token_expires_at = None
-        if tokens.expires_in:
-            token_expires_at = timezone.now() + timedelta(seconds=tokens.expires_in)
-        
         # Update or create account
         account, created = ConnectedAccount.objects.update_or_create(
             user_id=user_id,
@@ -251,18 +398,49 @@ class OAuthBaseService(ABC):
             platform_user_id=platform_user_id,
             defaults={
                 'platform_username': platform_username,
-                'access_token': encrypted_access_token,
-                'refresh_token': encrypted_refresh_token,
-                'token_expires_at': token_expires_at,
+                **self._token_columns(tokens),
                 'is_active': True,
             }
         )
         
         action = 'created' if created else 'updated'
-        print(f'[{self.platform}] Tokens {action} successfully for account {account.id}')
+        logger.info('[%s] Tokens %s successfully for account %s', self.platform, action, account.id)
         
         return str(account.id)
     
+    def update_stored_tokens(self, account_id: str, tokens: OAuthTokens) -> None:
+        """
+        Replace the tokens of an account that is already known
+        
+        Used on the refresh path: a single UPDATE by primary key instead of
+        store_tokens()' SELECT ... FOR UPDATE followed by an UPDATE.
+        
+        Args:
+            account_id: Connected account ID
+            tokens: New OAuth tokens
+        """
+        ConnectedAccount.objects.filter(id=account_id).update(
+            **self._token_columns(tokens),
+            is_active=True,
+            updated_at=timezone.now()
+        )
+        
+        logger.info('[%s] Tokens updated successfully for account %s', self.platform, account_id)
+    
+    def _token_columns(self, tokens: OAuthTokens) -> Dict:
+        """Encrypted token columns (and expiry) for a ConnectedAccount write"""
+        # Calculate token expiry
+        token_expires_at = None
+        if tokens.expires_in:
+            token_expires_at = timezone.now() + timedelta(seconds=tokens.expires_in)
+        
+        # Encrypt tokens before storage
+        return {
+            'access_token': encrypt(tokens.access_token),
+            'refresh_token': encrypt(tokens.refresh_token) if tokens.refresh_token else None,
+            'token_expires_at': token_expires_at,
+        }
+    
     def get_stored_tokens(self, account_id: str) -> StoredTokenData:
         """
         Retrieve and decrypt stored tokens
@@ -279,7 +457,11 @@ class OAuthBaseService(ABC):
             Exception: If account not found or inactive
         """
         try:
-            account = ConnectedAccount.objects.get(
+            account = ConnectedAccount.objects.only(
+                'access_token',
+                'refresh_token',
+                'token_expires_at'
+            ).get(
                 id=account_id,
                 platform=self.platform,
                 is_active=True
@@ -294,13 +476,16 @@ class OAuthBaseService(ABC):
         except ConnectedAccount.DoesNotExist:
             raise Exception('Account not found or inactive')
         except Exception as e:
-            print(f'[{self.platform}] Failed to retrieve tokens: {e}')
+            logger.error('[%s] Failed to retrieve tokens: %s', self.platform, e)
             raise Exception('Failed to retrieve stored tokens')
     
     def ensure_valid_token(self, account_id: str) -> str:
         """
         Check if token is expired and refresh if necessary
         
+        Tokens are normally refreshed ahead of time by
+        apps.oauth.tasks.refresh_expiring_tokens; this is the inline fallback.
+        
         Migrated from: ensureValidToken() in OAuthBaseService.ts
         
         Args:
@@ -311,32 +496,55 @@ class OAuthBaseService(ABC):
         """
         tokens = self.get_stored_tokens(account_id)
         
-        # If no expiry time, assume token is valid
-        if not tokens.expires_at:
+        if not self._needs_refresh(tokens):
             return tokens.access_token
         
-        # Check if token expires within next 5 minutes
-        expiry_buffer = timedelta(minutes=5)
-        is_expiring_soon = (
-            tokens.expires_at - timezone.now() < expiry_buffer
-        )
+        lock = acquire_refresh_lock(account_id, wait=REFRESH_LOCK_WAIT)
+        if lock is None:
+            raise Exception('Timed out waiting for token refresh')
         
-        if is_expiring_soon and tokens.refresh_token:
-            print(f'[{self.platform}] Token expiring soon, refreshing...')
-            new_tokens = self.refresh_access_token(tokens.refresh_token)
+        try:
+            # Another worker may have refreshed while we waited for the lock
+            tokens = self.get_stored_tokens(account_id)
+            if not self._needs_refresh(tokens):
+                return tokens.access_token
             
-            # Get account details for re-storing
-            account = ConnectedAccount.objects.get(id=account_id)
-            self.store_tokens(
-                str(account.user_id),
-                account.platform_user_id,
-                account.platform_username,
-                new_tokens
-            )
+            logger.debug('[%s] Token expiring soon, refreshing...', self.platform)
+            new_tokens = self.refresh_tokens(tokens.refresh_token)
+            
+            self.update_stored_tokens(account_id, new_tokens)
             
             return new_tokens.access_token
+        finally:
+            release_refresh_lock(lock)
+    
+    def refresh_tokens(self, refresh_token: str) -> OAuthTokens:
+        """
+        refresh_access_token(), keeping the current refresh token when the
+        provider doesn't return a new one
+        
+        Providers only rotate refresh tokens some of the time; storing the
+        response as-is would clear the column and end automatic refreshes
+        for the account.
+        
+        Args:
+            refresh_token: Refresh token
+            
+        Returns:
+            New OAuth tokens
+        """
+        tokens = self.refresh_access_token(refresh_token)
+        if not tokens.refresh_token:
+            tokens = replace(tokens, refresh_token=refresh_token)
+        return tokens
+    
+    def _needs_refresh(self, tokens: StoredTokenData) -> bool:
+        """Whether the token expires within TOKEN_EXPIRY_BUFFER and can be refreshed"""
+        # If no expiry time, assume token is valid
+        if not tokens.expires_at or not tokens.refresh_token:
+            return False
         
-        return tokens.access_token
+        return tokens.expires_at < timezone.now() + TOKEN_EXPIRY_BUFFER
     
     def revoke_token(self, account_id: str) -> None:
         """
@@ -347,8 +555,34 @@ class OAuthBaseService(ABC):
         Args:
             account_id: Connected account ID
         """
-        # Default implementation - platforms should override if they support revocation
-        print(f'[{self.platform}] Token revocation not implemented for this platform')
+        if not self.revokes_tokens:
+            logger.debug('[%s] Token revocation not implemented for this platform', self.platform)
+            return
+        
+        try:
+            tokens = self.get_stored_tokens(account_id)
+            self.revoke_access_token(tokens.access_token)
+        
+        except Exception as e:
+            logger.warning('[%s] Token revocation failed: %s', self.platform, e)
+            # Don't throw error - mark as inactive anyway
+    
+    def revoke_access_token(self, access_token: str) -> None:
+        """
+        Revoke a decrypted access token with the platform
+        
+        Used by revoke_token() and by the background
+        apps.oauth.tasks.revoke_provider_token task, which gets the token
+        before the account's credentials are cleared.
+        
+        Args:
+            access_token: Access token to revoke
+            
+        Raises:
+            requests.RequestException: If the provider can't be reached
+        """
+        # Default implementation - platforms with a revocation endpoint override this
+        logger.debug('[%s] Token revocation not implemented for this platform', self.platform)
     
     def parse_token_response(self, data: dict) -> OAuthTokens:
         """
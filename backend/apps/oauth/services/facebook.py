@@ -5,11 +5,14 @@ Uses Facebook Graph API for page messaging.
 Migrated from backend/src/services/oauth/FacebookOAuthService.ts
 """
 
+import logging
 from typing import Dict, List, Optional
 from django.conf import settings
 import requests
 
-from .base import OAuthBaseService, OAuthConfig, OAuthTokens
+from .base import HTTP_TIMEOUT, LONG_LIVED_TOKEN_MIN_EXPIRY, OAuthBaseService, OAuthConfig, OAuthTokens
+
+logger = logging.getLogger(__name__)
 
 
 class FacebookOAuthService(OAuthBaseService):
@@ -19,6 +22,8 @@ class FacebookOAuthService(OAuthBaseService):
     Migrated from: FacebookOAuthService in FacebookOAuthService.ts
     """
     
+    revokes_tokens = True
+    
     def __init__(self):
         config = OAuthConfig(
             client_id=settings.FACEBOOK_APP_ID,
@@ -56,7 +61,7 @@ class FacebookOAuthService(OAuthBaseService):
         """
         try:
             # Get short-lived token
-            response = requests.get(
+            response = self.session.get(
                 self.config.token_url,
                 params={
                     'client_id': self.config.client_id,
@@ -64,25 +69,35 @@ class FacebookOAuthService(OAuthBaseService):
                     'code': code,
                     'redirect_uri': self.config.redirect_uri,
                 },
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             
-            short_lived_token = response.json()['access_token']
+            data = response.json()
+            
+            # Meta sometimes issues a long-lived token straight away
+            expires_in = data.get('expires_in') or 0
+            if expires_in > LONG_LIVED_TOKEN_MIN_EXPIRY:
+                return OAuthTokens(
+                    access_token=data['access_token'],
+                    refresh_token=None,
+                    expires_in=expires_in,
+                    token_type=data.get('token_type', 'bearer')
+                )
             
             # Exchange for long-lived token (60 days)
-            return self.exchange_for_long_lived_token(short_lived_token)
+            return self.exchange_for_long_lived_token(data['access_token'])
         
         except requests.RequestException as e:
             error_msg = str(e)
-            if hasattr(e, 'response') and e.response is not None:
+            response = getattr(e, 'response', None)
+            if response is not None and response.content:
                 try:
-                    error_data = e.response.json()
-                    error_msg = error_data.get('error', {}).get('message', str(e))
-                except:
-                    pass
+                    error_msg = response.json().get('error', {}).get('message') or error_msg
+                except (ValueError, AttributeError):
+                    pass  # Not a Graph error object; keep the transport error
             
-            print(f'[facebook] Token exchange failed: {error_msg}')
+            logger.error('[facebook] Token exchange failed: %s', error_msg)
             raise Exception(f'Failed to exchange authorization code: {error_msg}')
     
     def exchange_for_long_lived_token(self, short_lived_token: str) -> OAuthTokens:
@@ -98,7 +113,7 @@ class FacebookOAuthService(OAuthBaseService):
             Long-lived OAuth tokens
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 'https://graph.facebook.com/v18.0/oauth/access_token',
                 params={
                     'grant_type': 'fb_exchange_token',
@@ -106,7 +121,7 @@ class FacebookOAuthService(OAuthBaseService):
                     'client_secret': self.config.client_secret,
                     'fb_exchange_token': short_lived_token,
                 },
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             data = response.json()
@@ -119,7 +134,7 @@ class FacebookOAuthService(OAuthBaseService):
             )
         
         except requests.RequestException as e:
-            print(f'[facebook] Long-lived token exchange failed: {e}')
+            logger.error('[facebook] Long-lived token exchange failed: %s', e)
             raise Exception('Failed to exchange for long-lived token')
     
     def get_page_access_token(self, user_access_token: str, page_id: str) -> str:
@@ -136,20 +151,20 @@ class FacebookOAuthService(OAuthBaseService):
             Page access token
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f'https://graph.facebook.com/v18.0/{page_id}',
                 params={
                     'fields': 'access_token',
                     'access_token': user_access_token,
                 },
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             
             return response.json()['access_token']
         
         except requests.RequestException as e:
-            print(f'[facebook] Failed to get page access token: {e}')
+            logger.error('[facebook] Failed to get page access token: %s', e)
             raise Exception('Failed to retrieve page access token')
     
     def refresh_access_token(
@@ -170,7 +185,7 @@ class FacebookOAuthService(OAuthBaseService):
             Refreshed OAuth tokens
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 'https://graph.facebook.com/v18.0/oauth/access_token',
                 params={
                     'grant_type': 'fb_exchange_token',
@@ -178,7 +193,7 @@ class FacebookOAuthService(OAuthBaseService):
                     'client_secret': self.config.client_secret,
                     'fb_exchange_token': access_token,
                 },
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             data = response.json()
@@ -191,7 +206,7 @@ class FacebookOAuthService(OAuthBaseService):
             )
         
         except requests.RequestException as e:
-            print(f'[facebook] Token refresh failed: {e}')
+            logger.error('[facebook] Token refresh failed: %s', e)
             raise Exception(f'Failed to refresh token: {e}')
     
     def get_user_pages(self, access_token: str) -> List[Dict]:
@@ -207,20 +222,20 @@ class FacebookOAuthService(OAuthBaseService):
             List of pages
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 'https://graph.facebook.com/v18.0/me/accounts',
                 params={
                     'access_token': access_token,
                     'fields': 'id,name,access_token,category',
                 },
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             
             return response.json().get('data', [])
         
         except requests.RequestException as e:
-            print(f'[facebook] Failed to get user pages: {e}')
+            logger.error('[facebook] Failed to get user pages: %s', e)
             raise Exception('Failed to retrieve Facebook pages')
     
     def get_user_info(self, access_token: str) -> Dict[str, str]:
@@ -251,7 +266,7 @@ class FacebookOAuthService(OAuthBaseService):
             }
         
         except Exception as e:
-            print(f'[facebook] Failed to get user info: {e}')
+            logger.error('[facebook] Failed to get user info: %s', e)
             raise Exception('Failed to retrieve Facebook page information')
     
     def get_page_info(self, page_id: str, access_token: str) -> Dict:
@@ -268,20 +283,20 @@ class FacebookOAuthService(OAuthBaseService):
             Page details
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f'https://graph.facebook.com/v18.0/{page_id}',
                 params={
                     'fields': 'id,name,category,picture',
                     'access_token': access_token,
                 },
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             
             return response.json()
         
         except requests.RequestException as e:
-            print(f'[facebook] Failed to get page info: {e}')
+            logger.error('[facebook] Failed to get page info: %s', e)
             raise Exception('Failed to retrieve page information')
     
     def subscribe_page_to_webhooks(self, page_id: str, page_access_token: str) -> bool:
@@ -298,46 +313,39 @@ class FacebookOAuthService(OAuthBaseService):
             True if successful
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 f'https://graph.facebook.com/v18.0/{page_id}/subscribed_apps',
                 params={
                     'subscribed_fields': 'messages,messaging_postbacks,messaging_optins,message_deliveries,message_reads',
                     'access_token': page_access_token,
                 },
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             
-            print('[facebook] Page subscribed to webhooks successfully')
+            logger.info('[facebook] Page subscribed to webhooks successfully')
             return response.json().get('success') is True
         
         except requests.RequestException as e:
-            print(f'[facebook] Webhook subscription failed: {e}')
+            logger.error('[facebook] Webhook subscription failed: %s', e)
             return False
     
-    def revoke_token(self, account_id: str) -> None:
+    def revoke_access_token(self, access_token: str) -> None:
         """
         Revoke Facebook OAuth token
         
         Migrated from: revokeToken() in FacebookOAuthService.ts
         
         Args:
-            account_id: Connected account ID
+            access_token: Access token to revoke
         """
-        try:
-            tokens = self.get_stored_tokens(account_id)
-            
-            requests.delete(
-                'https://graph.facebook.com/v18.0/me/permissions',
-                params={'access_token': tokens.access_token},
-                timeout=10
-            )
-            
-            print('[facebook] Token revoked successfully')
+        self.session.delete(
+            'https://graph.facebook.com/v18.0/me/permissions',
+            params={'access_token': access_token},
+            timeout=HTTP_TIMEOUT
+        )
         
-        except Exception as e:
-            print(f'[facebook] Token revocation failed: {e}')
-            # Don't throw error - mark as inactive anyway
+        logger.info('[facebook] Token revoked successfully')
     
     def validate_token(self, access_token: str) -> bool:
         """
@@ -352,15 +360,15 @@ class FacebookOAuthService(OAuthBaseService):
             True if token is valid
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 'https://graph.facebook.com/v18.0/me',
                 params={'access_token': access_token},
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             return 'id' in response.json()
         
-        except:
+        except (requests.RequestException, ValueError):
             return False
     
     def debug_token(self, access_token: str) -> Dict:
@@ -377,20 +385,20 @@ class FacebookOAuthService(OAuthBaseService):
         """
         try:
             app_token = f"{self.config.client_id}|{self.config.client_secret}"
-            response = requests.get(
+            response = self.session.get(
                 'https://graph.facebook.com/v18.0/debug_token',
                 params={
                     'input_token': access_token,
                     'access_token': app_token,
                 },
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             
             return response.json()['data']
         
         except requests.RequestException as e:
-            print(f'[facebook] Token debug failed: {e}')
+            logger.error('[facebook] Token debug failed: %s', e)
             raise Exception('Failed to debug token')
 
 
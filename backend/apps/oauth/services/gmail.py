@@ -5,13 +5,18 @@ Uses Google OAuth 2.0 with Gmail API for email access.
 Requirements: 10.1 - Authenticate via Google OAuth with gmail.readonly, gmail.send, and gmail.modify scopes
 """
 
+import logging
+from dataclasses import replace
 from typing import Dict, List, Optional
 from django.conf import settings
 from datetime import datetime, timedelta
+import random
 import requests
 import time
 
-from .base import OAuthBaseService, OAuthConfig, OAuthTokens
+from .base import HTTP_TIMEOUT, SLOW_HTTP_TIMEOUT, OAuthBaseService, OAuthConfig, OAuthTokens
+
+logger = logging.getLogger(__name__)
 
 
 class GmailOAuthService(OAuthBaseService):
@@ -26,6 +31,13 @@ class GmailOAuthService(OAuthBaseService):
     Requirements: 10.1 - Authenticate via Google OAuth with gmail.readonly, gmail.send, and gmail.modify scopes
     """
     
+    revokes_tokens = True
+    
+    authorization_params = {
+        'access_type': 'offline',  # Required for refresh tokens
+        'prompt': 'consent',       # Force consent to get refresh token
+    }
+    
     # Gmail API scopes required for email functionality
     # Reference: https://developers.google.com/gmail/api/auth/scopes
     GMAIL_SCOPES = [
@@ -49,33 +61,6 @@ class GmailOAuthService(OAuthBaseService):
         
         super().__init__('gmail', config)
     
-    def generate_authorization_url(
-        self, 
-        state: str, 
-        additional_params: Optional[Dict[str, str]] = None
-    ) -> str:
-        """
-        Generate Google OAuth 2.0 authorization URL with Gmail-specific parameters.
-        
-        Args:
-            state: Random state parameter for CSRF protection
-            additional_params: Platform-specific additional parameters
-            
-        Returns:
-            Authorization URL
-            
-        Requirements: 10.1 - Authenticate via Google OAuth
-        """
-        params = {
-            'access_type': 'offline',  # Required for refresh tokens
-            'prompt': 'consent',       # Force consent to get refresh token
-        }
-        
-        if additional_params:
-            params.update(additional_params)
-        
-        return super().generate_authorization_url(state, params)
-    
     def exchange_code_for_token(
         self, 
         code: str, 
@@ -94,22 +79,16 @@ class GmailOAuthService(OAuthBaseService):
         Requirements: 10.1 - Authenticate via Google OAuth
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.config.token_url,
-                data={
-                    'client_id': self.config.client_id,
-                    'client_secret': self.config.client_secret,
-                    'code': code,
-                    'redirect_uri': self.config.redirect_uri,
-                    'grant_type': 'authorization_code',
-                },
+                data={**self._exchange_body, 'code': code},
                 headers={'Content-Type': 'application/x-www-form-urlencoded'},
-                timeout=30
+                timeout=SLOW_HTTP_TIMEOUT
             )
             response.raise_for_status()
             
             tokens = self.parse_token_response(response.json())
-            print(f'[gmail] Token exchange successful')
+            logger.info('[gmail] Token exchange successful')
             return tokens
         
         except requests.RequestException as e:
@@ -120,7 +99,7 @@ class GmailOAuthService(OAuthBaseService):
                     error_data = e.response.json()
                     error_msg = error_data.get('error_description', str(e))
                     error_code = error_data.get('error')
-                except:
+                except (ValueError, AttributeError):
                     pass
             
             # Provide helpful error messages for common issues
@@ -129,7 +108,7 @@ class GmailOAuthService(OAuthBaseService):
             elif error_code == 'invalid_client':
                 error_msg = 'Invalid client credentials. Check GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET.'
             
-            print(f'[gmail] Token exchange failed: {error_code} - {error_msg}')
+            logger.error('[gmail] Token exchange failed: %s - %s', error_code, error_msg)
             raise Exception(f'Failed to exchange authorization code: {error_msg}')
     
     def refresh_access_token(
@@ -140,6 +119,9 @@ class GmailOAuthService(OAuthBaseService):
         """
         Refresh Gmail access token with exponential backoff.
         
+        Only transport errors, 5xx and 429 are retried; any other 4xx
+        (invalid_grant, invalid_client, ...) fails on the first attempt.
+        
         Args:
             refresh_token: Refresh token
             additional_params: Not used
@@ -153,60 +135,56 @@ class GmailOAuthService(OAuthBaseService):
             raise Exception('Refresh token is required')
         
         max_retries = 3
-        last_error = None
         
         for retry in range(max_retries):
             try:
-                response = requests.post(
+                response = self.session.post(
                     self.config.token_url,
-                    data={
-                        'client_id': self.config.client_id,
-                        'client_secret': self.config.client_secret,
-                        'refresh_token': refresh_token,
-                        'grant_type': 'refresh_token',
-                    },
+                    data={**self._refresh_body, 'refresh_token': refresh_token},
                     headers={'Content-Type': 'application/x-www-form-urlencoded'},
-                    timeout=30
+                    timeout=SLOW_HTTP_TIMEOUT
                 )
                 response.raise_for_status()
                 
                 tokens = self.parse_token_response(response.json())
                 # Google doesn't return refresh_token on refresh, keep the old one
                 if not tokens.refresh_token:
-                    tokens.refresh_token = refresh_token
+                    tokens = replace(tokens, refresh_token=refresh_token)
                 
-                print(f'[gmail] Token refresh successful')
+                logger.info('[gmail] Token refresh successful')
                 return tokens
             
             except requests.RequestException as e:
-                last_error = e
                 error_msg = str(e)
                 error_code = None
                 is_retryable = True
                 
-                if hasattr(e, 'response') and e.response is not None:
+                response = getattr(e, 'response', None)
+                if response is not None:
                     try:
-                        error_data = e.response.json()
+                        error_data = response.json()
                         error_msg = error_data.get('error_description', str(e))
                         error_code = error_data.get('error')
-                    except:
+                    except (ValueError, AttributeError):
                         pass
                     
-                    # Check for non-retryable errors
-                    status_code = e.response.status_code
-                    if status_code in [400, 401, 403]:
+                    # A rejected grant or client won't succeed on retry;
+                    # only rate limiting (429) is worth waiting out
+                    status_code = response.status_code
+                    if 400 <= status_code < 500 and status_code != 429:
                         is_retryable = False
                         if error_code == 'invalid_grant':
                             error_msg = 'Refresh token expired or revoked. User needs to re-authenticate.'
                 
-                print(f'[gmail] Token refresh attempt {retry + 1}/{max_retries} failed: {error_code} - {error_msg}')
+                logger.warning('[gmail] Token refresh attempt %d/%d failed: %s - %s', retry + 1, max_retries, error_code, error_msg)
                 
                 if not is_retryable or retry >= max_retries - 1:
                     raise Exception(f'Failed to refresh token: {error_msg}')
                 
-                # Exponential backoff: 1s, 2s, 4s
-                backoff_time = 2 ** retry
-                print(f'[gmail] Retrying in {backoff_time}s...')
+                # Exponential backoff with full jitter (up to 1s, 2s), so
+                # workers don't retry in lockstep after a Google outage
+                backoff_time = random.uniform(0, 2 ** retry)
+                logger.debug('[gmail] Retrying in %.1fs...', backoff_time)
                 time.sleep(backoff_time)
         
         raise Exception(f'Token refresh failed after {max_retries} attempts')
@@ -222,10 +200,10 @@ class GmailOAuthService(OAuthBaseService):
             Dict with 'userId' and 'username'
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 'https://www.googleapis.com/oauth2/v2/userinfo',
                 headers={'Authorization': f'Bearer {access_token}'},
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             user_data = response.json()
@@ -236,34 +214,28 @@ class GmailOAuthService(OAuthBaseService):
             }
         
         except requests.RequestException as e:
-            print(f'[gmail] Failed to get user info: {e}')
+            logger.error('[gmail] Failed to get user info: %s', e)
             raise Exception('Failed to retrieve Google user information')
     
-    def revoke_token(self, account_id: str) -> None:
+    def revoke_access_token(self, access_token: str) -> None:
         """
         Revoke Google OAuth token.
         
         Args:
-            account_id: Connected account ID
+            access_token: Access token to revoke
         """
-        try:
-            tokens = self.get_stored_tokens(account_id)
-            
-            # Google supports token revocation
-            response = requests.post(
-                'https://oauth2.googleapis.com/revoke',
-                params={'token': tokens.access_token},
-                headers={'Content-Type': 'application/x-www-form-urlencoded'},
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                print('[gmail] Token revoked successfully')
-            else:
-                print(f'[gmail] Token revocation returned status {response.status_code}')
+        # Google supports token revocation
+        response = self.session.post(
+            'https://oauth2.googleapis.com/revoke',
+            params={'token': access_token},
+            headers={'Content-Type': 'application/x-www-form-urlencoded'},
+            timeout=HTTP_TIMEOUT
+        )
         
-        except Exception as e:
-            print(f'[gmail] Failed to revoke token: {e}')
+        if response.status_code == 200:
+            logger.info('[gmail] Token revoked successfully')
+        else:
+            logger.warning('[gmail] Token revocation returned status %s', response.status_code)
     
     def validate_token(self, access_token: str) -> bool:
         """
@@ -276,15 +248,15 @@ class GmailOAuthService(OAuthBaseService):
             True if token is valid
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 'https://www.googleapis.com/oauth2/v1/tokeninfo',
                 params={'access_token': access_token},
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             return True
         
-        except:
+        except requests.RequestException:
             return False
 
 
@@ -5,11 +5,14 @@ Uses Facebook Graph API for Instagram Business accounts.
 Migrated from backend/src/services/oauth/InstagramOAuthService.ts
 """
 
+import logging
 from typing import Dict, Optional
 from django.conf import settings
 import requests
 
-from .base import OAuthBaseService, OAuthConfig, OAuthTokens
+from .base import HTTP_TIMEOUT, LONG_LIVED_TOKEN_MIN_EXPIRY, OAuthBaseService, OAuthConfig, OAuthTokens
+
+logger = logging.getLogger(__name__)
 
 
 class InstagramOAuthService(OAuthBaseService):
@@ -19,6 +22,8 @@ class InstagramOAuthService(OAuthBaseService):
     Migrated from: InstagramOAuthService in InstagramOAuthService.ts
     """
     
+    revokes_tokens = True
+    
     def __init__(self):
         config = OAuthConfig(
             client_id=settings.INSTAGRAM_APP_ID,
@@ -55,7 +60,7 @@ class InstagramOAuthService(OAuthBaseService):
         """
         try:
             # Get short-lived token
-            response = requests.get(
+            response = self.session.get(
                 self.config.token_url,
                 params={
                     'client_id': self.config.client_id,
@@ -63,14 +68,24 @@ class InstagramOAuthService(OAuthBaseService):
                     'code': code,
                     'redirect_uri': self.config.redirect_uri,
                 },
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             
-            short_lived_token = response.json()['access_token']
+            data = response.json()
+            
+            # Meta sometimes issues a long-lived token straight away
+            expires_in = data.get('expires_in') or 0
+            if expires_in > LONG_LIVED_TOKEN_MIN_EXPIRY:
+                return OAuthTokens(
+                    access_token=data['access_token'],
+                    refresh_token=None,
+                    expires_in=expires_in,
+                    token_type=data.get('token_type', 'bearer')
+                )
             
             # Exchange for long-lived token (60 days)
-            return self.exchange_for_long_lived_token(short_lived_token)
+            return self.exchange_for_long_lived_token(data['access_token'])
         
         except requests.RequestException as e:
             error_msg = str(e)
@@ -78,10 +93,10 @@ class InstagramOAuthService(OAuthBaseService):
                 try:
                     error_data = e.response.json()
                     error_msg = error_data.get('error', {}).get('message', str(e))
-                except:
+                except (ValueError, AttributeError):
                     pass
             
-            print(f'[instagram] Token exchange failed: {error_msg}')
+            logger.error('[instagram] Token exchange failed: %s', error_msg)
             raise Exception(f'Failed to exchange authorization code: {error_msg}')
     
     def exchange_for_long_lived_token(self, short_lived_token: str) -> OAuthTokens:
@@ -97,7 +112,7 @@ class InstagramOAuthService(OAuthBaseService):
             Long-lived OAuth tokens
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 'https://graph.facebook.com/v18.0/oauth/access_token',
                 params={
                     'grant_type': 'fb_exchange_token',
@@ -105,7 +120,7 @@ class InstagramOAuthService(OAuthBaseService):
                     'client_secret': self.config.client_secret,
                     'fb_exchange_token': short_lived_token,
                 },
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             data = response.json()
@@ -118,7 +133,7 @@ class InstagramOAuthService(OAuthBaseService):
             )
         
         except requests.RequestException as e:
-            print(f'[instagram] Long-lived token exchange failed: {e}')
+            logger.error('[instagram] Long-lived token exchange failed: %s', e)
             raise Exception('Failed to exchange for long-lived token')
     
     def refresh_access_token(
@@ -139,7 +154,7 @@ class InstagramOAuthService(OAuthBaseService):
             Refreshed OAuth tokens
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 'https://graph.facebook.com/v18.0/oauth/access_token',
                 params={
                     'grant_type': 'fb_exchange_token',
@@ -147,7 +162,7 @@ class InstagramOAuthService(OAuthBaseService):
                     'client_secret': self.config.client_secret,
                     'fb_exchange_token': access_token,
                 },
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             data = response.json()
@@ -165,10 +180,10 @@ class InstagramOAuthService(OAuthBaseService):
                 try:
                     error_data = e.response.json()
                     error_msg = error_data.get('error', {}).get('message', str(e))
-                except:
+                except (ValueError, AttributeError):
                     pass
             
-            print(f'[instagram] Token refresh failed: {error_msg}')
+            logger.error('[instagram] Token refresh failed: %s', error_msg)
             raise Exception(f'Failed to refresh token: {error_msg}')
     
     def get_user_info(self, access_token: str) -> Dict[str, str]:
@@ -185,13 +200,13 @@ class InstagramOAuthService(OAuthBaseService):
         """
         try:
             # Get Facebook user info (works with public_profile)
-            response = requests.get(
+            response = self.session.get(
                 'https://graph.facebook.com/v18.0/me',
                 params={
                     'fields': 'id,name',
                     'access_token': access_token,
                 },
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             user_data = response.json()
@@ -204,7 +219,7 @@ class InstagramOAuthService(OAuthBaseService):
             }
         
         except requests.RequestException as e:
-            print(f'[instagram] Failed to get user info: {e}')
+            logger.error('[instagram] Failed to get user info: %s', e)
             raise Exception('Failed to retrieve user information')
     
     def get_instagram_account_id(self, access_token: str, page_id: str) -> str:
@@ -221,13 +236,13 @@ class InstagramOAuthService(OAuthBaseService):
             Instagram Business account ID
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f'https://graph.facebook.com/v18.0/{page_id}',
                 params={
                     'fields': 'instagram_business_account',
                     'access_token': access_token,
                 },
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             data = response.json()
@@ -236,32 +251,25 @@ class InstagramOAuthService(OAuthBaseService):
             return instagram_account.get('id', '')
         
         except requests.RequestException as e:
-            print(f'[instagram] Failed to get Instagram account ID: {e}')
+            logger.error('[instagram] Failed to get Instagram account ID: %s', e)
             raise Exception('Failed to retrieve Instagram Business account ID')
     
-    def revoke_token(self, account_id: str) -> None:
+    def revoke_access_token(self, access_token: str) -> None:
         """
         Revoke Instagram OAuth token
         
         Migrated from: revokeToken() in InstagramOAuthService.ts
         
         Args:
-            account_id: Connected account ID
+            access_token: Access token to revoke
         """
-        try:
-            tokens = self.get_stored_tokens(account_id)
-            
-            requests.delete(
-                'https://graph.facebook.com/v18.0/me/permissions',
-                params={'access_token': tokens.access_token},
-                timeout=10
-            )
-            
-            print('[instagram] Token revoked successfully')
+        self.session.delete(
+            'https://graph.facebook.com/v18.0/me/permissions',
+            params={'access_token': access_token},
+            timeout=HTTP_TIMEOUT
+        )
         
-        except Exception as e:
-            print(f'[instagram] Token revocation failed: {e}')
-            # Don't throw error - mark as inactive anyway
+        logger.info('[instagram] Token revoked successfully')
     
     def validate_token(self, access_token: str) -> bool:
         """
@@ -276,15 +284,15 @@ class InstagramOAuthService(OAuthBaseService):
             True if token is valid
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 'https://graph.facebook.com/v18.0/me',
                 params={'access_token': access_token},
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             return 'id' in response.json()
         
-        except:
+        except (requests.RequestException, ValueError):
             return False
 
 
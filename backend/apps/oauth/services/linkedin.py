@@ -5,11 +5,14 @@ Implements OAuth 2.0 for LinkedIn API.
 Migrated from backend/src/services/oauth/LinkedInOAuthService.ts
 """
 
+import logging
 from typing import Dict, Optional
 from django.conf import settings
 import requests
 
-from .base import OAuthBaseService, OAuthConfig, OAuthTokens
+from .base import HTTP_TIMEOUT, OAuthBaseService, OAuthConfig, OAuthTokens
+
+logger = logging.getLogger(__name__)
 
 
 class LinkedInOAuthService(OAuthBaseService):
@@ -56,17 +59,11 @@ class LinkedInOAuthService(OAuthBaseService):
             OAuth tokens
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.config.token_url,
-                data={
-                    'grant_type': 'authorization_code',
-                    'code': code,
-                    'client_id': self.config.client_id,
-                    'client_secret': self.config.client_secret,
-                    'redirect_uri': self.config.redirect_uri,
-                },
+                data={**self._exchange_body, 'code': code},
                 headers={'Content-Type': 'application/x-www-form-urlencoded'},
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             
@@ -78,10 +75,10 @@ class LinkedInOAuthService(OAuthBaseService):
                 try:
                     error_data = e.response.json()
                     error_msg = error_data.get('error_description', str(e))
-                except:
+                except (ValueError, AttributeError):
                     pass
             
-            print(f'[linkedin] Token exchange failed: {error_msg}')
+            logger.error('[linkedin] Token exchange failed: %s', error_msg)
             raise Exception(f'Failed to exchange authorization code: {error_msg}')
     
     def refresh_access_token(
@@ -103,16 +100,11 @@ class LinkedInOAuthService(OAuthBaseService):
             New OAuth tokens
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.config.token_url,
-                data={
-                    'grant_type': 'refresh_token',
-                    'refresh_token': refresh_token,
-                    'client_id': self.config.client_id,
-                    'client_secret': self.config.client_secret,
-                },
+                data={**self._refresh_body, 'refresh_token': refresh_token},
                 headers={'Content-Type': 'application/x-www-form-urlencoded'},
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             
@@ -124,10 +116,10 @@ class LinkedInOAuthService(OAuthBaseService):
                 try:
                     error_data = e.response.json()
                     error_msg = error_data.get('error_description', str(e))
-                except:
+                except (ValueError, AttributeError):
                     pass
             
-            print(f'[linkedin] Token refresh failed: {error_msg}')
+            logger.error('[linkedin] Token refresh failed: %s', error_msg)
             raise Exception(f'Failed to refresh token: {error_msg}')
     
     def get_user_info(self, access_token: str) -> Dict[str, str]:
@@ -144,10 +136,10 @@ class LinkedInOAuthService(OAuthBaseService):
         """
         try:
             # Use OpenID Connect userinfo endpoint
-            response = requests.get(
+            response = self.session.get(
                 'https://api.linkedin.com/v2/userinfo',
                 headers={'Authorization': f'Bearer {access_token}'},
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             profile_data = response.json()
@@ -161,7 +153,7 @@ class LinkedInOAuthService(OAuthBaseService):
             }
         
         except requests.RequestException as e:
-            print(f'[linkedin] Failed to get user info: {e}')
+            logger.error('[linkedin] Failed to get user info: %s', e)
             raise Exception('Failed to retrieve LinkedIn user information')
     
     def get_user_email(self, access_token: str) -> str:
@@ -177,10 +169,10 @@ class LinkedInOAuthService(OAuthBaseService):
             User email
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 'https://api.linkedin.com/v2/emailAddress?q=members&projection=(elements*(handle~))',
                 headers={'Authorization': f'Bearer {access_token}'},
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             data = response.json()
@@ -189,7 +181,7 @@ class LinkedInOAuthService(OAuthBaseService):
             return email_data.get('emailAddress', '')
         
         except requests.RequestException as e:
-            print(f'[linkedin] Failed to get user email: {e}')
+            logger.error('[linkedin] Failed to get user email: %s', e)
             return ''
     
     def revoke_token(self, account_id: str) -> None:
@@ -202,7 +194,7 @@ class LinkedInOAuthService(OAuthBaseService):
         Args:
             account_id: Connected account ID
         """
-        print('[linkedin] LinkedIn does not support programmatic token revocation')
+        logger.debug('[linkedin] LinkedIn does not support programmatic token revocation')
         # Token will expire after 60 days or when user revokes access manually
     
     def validate_token(self, access_token: str) -> bool:
@@ -218,15 +210,15 @@ class LinkedInOAuthService(OAuthBaseService):
             True if token is valid
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 'https://api.linkedin.com/v2/me',
                 headers={'Authorization': f'Bearer {access_token}'},
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             return True
         
-        except:
+        except requests.RequestException:
             return False
 
 
@@ -6,13 +6,30 @@ Migrated from backend/src/services/oauth/MicrosoftTeamsOAuthService.ts
 Updated to support both personal + work account sign-in while keeping Teams scopes user-consent friendly.
 """
 
+import logging
 from typing import Dict, List, Optional, Any
 from django.conf import settings
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+import random
 import requests
 import time
 
-from .base import OAuthBaseService, OAuthConfig, OAuthTokens
+from .base import HTTP_TIMEOUT, MAX_RETRY_SLEEP, SLOW_HTTP_TIMEOUT, OAuthBaseService, OAuthConfig, OAuthTokens
+
+logger = logging.getLogger(__name__)
+
+# Graph caps chat message subscriptions at one hour. Each subscription
+# gets a random lifetime between 50 and 60 minutes, so subscriptions
+# created together (deploys, signup bursts) don't all come up for
+# renewal in the same minute.
+SUBSCRIPTION_LIFETIME_MINUTES = (50, 60)
+
+
+def _subscription_expiry() -> str:
+    """expirationDateTime for a new or renewed subscription, in UTC"""
+    lifetime = timedelta(minutes=random.uniform(*SUBSCRIPTION_LIFETIME_MINUTES))
+    expires_at = datetime.now(timezone.utc) + lifetime
+    return expires_at.strftime('%Y-%m-%dT%H:%M:%SZ')
 
 
 class MicrosoftTeamsOAuthService(OAuthBaseService):
@@ -81,23 +98,20 @@ class MicrosoftTeamsOAuthService(OAuthBaseService):
         Requirements: 8.1 - Authenticate via Microsoft OAuth for work/education accounts
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.config.token_url,
                 data={
-                    'client_id': self.config.client_id,
-                    'client_secret': self.config.client_secret,
+                    **self._exchange_body,
                     'code': code,
-                    'redirect_uri': self.config.redirect_uri,
-                    'grant_type': 'authorization_code',
-                    'scope': ' '.join(self.config.scopes),
+                    'scope': self.scope_string,
                 },
                 headers={'Content-Type': 'application/x-www-form-urlencoded'},
-                timeout=30  # Increased timeout for token exchange
+                timeout=SLOW_HTTP_TIMEOUT  # Increased timeout for token exchange
             )
             response.raise_for_status()
             
             tokens = self.parse_token_response(response.json())
-            print(f'[teams] Token exchange successful')
+            logger.info('[teams] Token exchange successful')
             return tokens
         
         except requests.RequestException as e:
@@ -108,7 +122,7 @@ class MicrosoftTeamsOAuthService(OAuthBaseService):
                     error_data = e.response.json()
                     error_msg = error_data.get('error_description', str(e))
                     error_code = error_data.get('error')
-                except:
+                except (ValueError, AttributeError):
                     pass
             
             # Provide helpful error messages for common issues
@@ -119,7 +133,7 @@ class MicrosoftTeamsOAuthService(OAuthBaseService):
             elif error_code == 'invalid_client':
                 error_msg = 'Invalid client credentials. Check MICROSOFT_CLIENT_ID and MICROSOFT_CLIENT_SECRET.'
             
-            print(f'[teams] Token exchange failed: {error_code} - {error_msg}')
+            logger.error('[teams] Token exchange failed: %s - %s', error_code, error_msg)
             raise Exception(f'Failed to exchange authorization code: {error_msg}')
     
     def refresh_access_token(
@@ -130,6 +144,9 @@ class MicrosoftTeamsOAuthService(OAuthBaseService):
         """
         Refresh Microsoft Teams access token with exponential backoff
         
+        Only transport errors, 5xx and 429 are retried; any other 4xx
+        (invalid_grant, invalid_client, ...) fails on the first attempt.
+        
         Migrated from: refreshAccessToken() in MicrosoftTeamsOAuthService.ts
         
         Args:
@@ -145,57 +162,62 @@ class MicrosoftTeamsOAuthService(OAuthBaseService):
             raise Exception('Refresh token is required')
         
         max_retries = 3
-        last_error = None
         
         for retry in range(max_retries):
             try:
-                response = requests.post(
+                response = self.session.post(
                     self.config.token_url,
                     data={
-                        'client_id': self.config.client_id,
-                        'client_secret': self.config.client_secret,
+                        **self._refresh_body,
                         'refresh_token': refresh_token,
-                        'grant_type': 'refresh_token',
-                        'scope': ' '.join(self.config.scopes),
+                        'scope': self.scope_string,
                     },
                     headers={'Content-Type': 'application/x-www-form-urlencoded'},
-                    timeout=30  # Increased timeout
+                    timeout=SLOW_HTTP_TIMEOUT  # Increased timeout
                 )
                 response.raise_for_status()
                 
                 tokens = self.parse_token_response(response.json())
-                print(f'[teams] Token refresh successful')
+                logger.info('[teams] Token refresh successful')
                 return tokens
             
             except requests.RequestException as e:
-                last_error = e
                 error_msg = str(e)
                 error_code = None
                 is_retryable = True
+                # Exponential backoff with full jitter (up to 1s, 2s), so
+                # workers don't retry in lockstep after an Azure AD outage
+                backoff_time = random.uniform(0, 2 ** retry)
                 
-                if hasattr(e, 'response') and e.response is not None:
+                response = getattr(e, 'response', None)
+                if response is not None:
                     try:
-                        error_data = e.response.json()
+                        error_data = response.json()
                         error_msg = error_data.get('error_description', str(e))
                         error_code = error_data.get('error')
-                    except:
+                    except (ValueError, AttributeError):
                         pass
                     
-                    # Check for non-retryable errors
-                    status_code = e.response.status_code
-                    if status_code in [400, 401, 403]:
+                    # A rejected grant or client won't succeed on retry;
+                    # only rate limiting (429) is worth waiting out
+                    status_code = response.status_code
+                    if 400 <= status_code < 500 and status_code != 429:
                         is_retryable = False
                         if error_code == 'invalid_grant':
                             error_msg = 'Refresh token expired or revoked. User needs to re-authenticate.'
+                    
+                    # Honour Retry-After, but not past MAX_RETRY_SLEEP: the
+                    # refresh lock has to outlive this wait
+                    retry_after = response.headers.get('Retry-After', '')
+                    if status_code == 429 and retry_after.isdigit():
+                        backoff_time = min(int(retry_after), MAX_RETRY_SLEEP)
                 
-                print(f'[teams] Token refresh attempt {retry + 1}/{max_retries} failed: {error_code} - {error_msg}')
+                logger.warning('[teams] Token refresh attempt %d/%d failed: %s - %s', retry + 1, max_retries, error_code, error_msg)
                 
                 if not is_retryable or retry >= max_retries - 1:
                     raise Exception(f'Failed to refresh token: {error_msg}')
                 
-                # Exponential backoff: 1s, 2s, 4s
-                backoff_time = 2 ** retry
-                print(f'[teams] Retrying in {backoff_time}s...')
+                logger.debug('[teams] Retrying in %.1fs...', backoff_time)
                 time.sleep(backoff_time)
         
         raise Exception(f'Token refresh failed after {max_retries} attempts')
@@ -213,10 +235,10 @@ class MicrosoftTeamsOAuthService(OAuthBaseService):
             Dict with 'userId' and 'username'
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 'https://graph.microsoft.com/v1.0/me',
                 headers={'Authorization': f'Bearer {access_token}'},
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             user_data = response.json()
@@ -227,7 +249,7 @@ class MicrosoftTeamsOAuthService(OAuthBaseService):
             }
         
         except requests.RequestException as e:
-            print(f'[teams] Failed to get user info: {e}')
+            logger.error('[teams] Failed to get user info: %s', e)
             raise Exception('Failed to retrieve Microsoft Teams user information')
     
     def get_user_chats(self, access_token: str) -> List[Dict]:
@@ -243,17 +265,17 @@ class MicrosoftTeamsOAuthService(OAuthBaseService):
             List of chats
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 'https://graph.microsoft.com/v1.0/me/chats',
                 headers={'Authorization': f'Bearer {access_token}'},
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             
             return response.json().get('value', [])
         
         except requests.RequestException as e:
-            print(f'[teams] Failed to get user chats: {e}')
+            logger.error('[teams] Failed to get user chats: %s', e)
             raise Exception('Failed to retrieve Teams chats')
     
     def get_chat_messages(self, access_token: str, chat_id: str) -> List[Dict]:
@@ -270,17 +292,17 @@ class MicrosoftTeamsOAuthService(OAuthBaseService):
             List of messages
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f'https://graph.microsoft.com/v1.0/me/chats/{chat_id}/messages',
                 headers={'Authorization': f'Bearer {access_token}'},
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             
             return response.json().get('value', [])
         
         except requests.RequestException as e:
-            print(f'[teams] Failed to get chat messages: {e}')
+            logger.error('[teams] Failed to get chat messages: %s', e)
             raise Exception('Failed to retrieve chat messages')
     
     def create_chat_subscription(self, access_token: str, notification_url: str) -> Dict:
@@ -297,30 +319,28 @@ class MicrosoftTeamsOAuthService(OAuthBaseService):
             Subscription details
         """
         try:
-            expiration_datetime = datetime.utcnow() + timedelta(hours=1)  # 1 hour max
-            
-            response = requests.post(
+            response = self.session.post(
                 'https://graph.microsoft.com/v1.0/subscriptions',
                 json={
                     'changeType': 'created,updated',
                     'notificationUrl': notification_url,
                     'resource': '/me/chats/getAllMessages',
-                    'expirationDateTime': expiration_datetime.isoformat() + 'Z',
+                    'expirationDateTime': _subscription_expiry(),
                     'clientState': getattr(settings, 'TEAMS_CLIENT_STATE', 'teams_webhook_secret'),
                 },
                 headers={
                     'Authorization': f'Bearer {access_token}',
                     'Content-Type': 'application/json',
                 },
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             
-            print('[teams] Chat subscription created successfully')
+            logger.debug('[teams] Chat subscription created successfully')
             return response.json()
         
         except requests.RequestException as e:
-            print(f'[teams] Failed to create subscription: {e}')
+            logger.error('[teams] Failed to create subscription: %s', e)
             raise Exception('Failed to create Teams chat subscription')
     
     def renew_chat_subscription(self, access_token: str, subscription_id: str) -> Dict:
@@ -337,26 +357,24 @@ class MicrosoftTeamsOAuthService(OAuthBaseService):
             Updated subscription details
         """
         try:
-            expiration_datetime = datetime.utcnow() + timedelta(hours=1)
-            
-            response = requests.patch(
+            response = self.session.patch(
                 f'https://graph.microsoft.com/v1.0/subscriptions/{subscription_id}',
                 json={
-                    'expirationDateTime': expiration_datetime.isoformat() + 'Z',
+                    'expirationDateTime': _subscription_expiry(),
                 },
                 headers={
                     'Authorization': f'Bearer {access_token}',
                     'Content-Type': 'application/json',
                 },
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             
-            print('[teams] Chat subscription renewed successfully')
+            logger.debug('[teams] Chat subscription renewed successfully')
             return response.json()
         
         except requests.RequestException as e:
-            print(f'[teams] Failed to renew subscription: {e}')
+            logger.error('[teams] Failed to renew subscription: %s', e)
             raise Exception('Failed to renew Teams chat subscription')
     
     def delete_chat_subscription(self, access_token: str, subscription_id: str) -> None:
@@ -370,16 +388,16 @@ class MicrosoftTeamsOAuthService(OAuthBaseService):
             subscription_id: Subscription ID
         """
         try:
-            requests.delete(
+            self.session.delete(
                 f'https://graph.microsoft.com/v1.0/subscriptions/{subscription_id}',
                 headers={'Authorization': f'Bearer {access_token}'},
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             
-            print('[teams] Chat subscription deleted successfully')
+            logger.debug('[teams] Chat subscription deleted successfully')
         
         except requests.RequestException as e:
-            print(f'[teams] Failed to delete subscription: {e}')
+            logger.error('[teams] Failed to delete subscription: %s', e)
             # Don't throw - subscription may have already expired
     
     def revoke_token(self, account_id: str) -> None:
@@ -392,7 +410,7 @@ class MicrosoftTeamsOAuthService(OAuthBaseService):
         Args:
             account_id: Connected account ID
         """
-        print('[teams] Microsoft does not support direct token revocation')
+        logger.debug('[teams] Microsoft does not support direct token revocation')
         # Token will expire after 1 hour or when user revokes access manually
         # We should delete any active subscriptions
     
@@ -409,15 +427,15 @@ class MicrosoftTeamsOAuthService(OAuthBaseService):
             True if token is valid
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 'https://graph.microsoft.com/v1.0/me',
                 headers={'Authorization': f'Bearer {access_token}'},
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             return True
         
-        except:
+        except requests.RequestException:
             return False
     
     def get_user_presence(self, access_token: str) -> Optional[Dict]:
@@ -433,17 +451,17 @@ class MicrosoftTeamsOAuthService(OAuthBaseService):
             Presence information or None
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 'https://graph.microsoft.com/v1.0/me/presence',
                 headers={'Authorization': f'Bearer {access_token}'},
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             
             return response.json()
         
         except requests.RequestException as e:
-            print(f'[teams] Failed to get user presence: {e}')
+            logger.warning('[teams] Failed to get user presence: %s', e)
             return None
 
 
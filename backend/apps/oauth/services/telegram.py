@@ -6,6 +6,7 @@ Users authenticate via Telegram Login Widget or direct bot interaction.
 Migrated from backend/src/services/oauth/TelegramOAuthService.ts
 """
 
+import logging
 import hashlib
 import hmac
 import time
@@ -14,7 +15,9 @@ from urllib.parse import urlencode
 from django.conf import settings
 import requests
 
-from .base import OAuthBaseService, OAuthConfig, OAuthTokens
+from .base import HTTP_TIMEOUT, OAuthBaseService, OAuthConfig, OAuthTokens
+
+logger = logging.getLogger(__name__)
 
 
 class TelegramOAuthService(OAuthBaseService):
@@ -198,14 +201,14 @@ class TelegramOAuthService(OAuthBaseService):
             True if token is valid
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f'https://api.telegram.org/bot{self.bot_token}/getMe',
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             return response.json().get('ok') is True
         
-        except:
+        except (requests.RequestException, ValueError):
             return False
     
     def get_bot_info(self) -> Dict:
@@ -218,16 +221,16 @@ class TelegramOAuthService(OAuthBaseService):
             Bot details
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f'https://api.telegram.org/bot{self.bot_token}/getMe',
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             
             return response.json()['result']
         
         except requests.RequestException as e:
-            print(f'[telegram] Failed to get bot info: {e}')
+            logger.error('[telegram] Failed to get bot info: %s', e)
             raise Exception('Failed to retrieve bot information')
     
     def revoke_token(self, account_id: str) -> None:
@@ -239,7 +242,7 @@ class TelegramOAuthService(OAuthBaseService):
         Args:
             account_id: Connected account ID
         """
-        print('[telegram] Bot tokens cannot be revoked programmatically')
+        logger.debug('[telegram] Bot tokens cannot be revoked programmatically')
         # Mark account as inactive in database
         # The actual revocation happens when user blocks the bot
 
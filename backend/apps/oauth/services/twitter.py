@@ -5,6 +5,7 @@ Implements OAuth 2.0 with PKCE (Proof Key for Code Exchange).
 Migrated from backend/src/services/oauth/TwitterOAuthService.ts
 """
 
+import logging
 import hashlib
 import base64
 import secrets
@@ -13,7 +14,9 @@ from django.conf import settings
 from django.core.cache import cache
 import requests
 
-from .base import OAuthBaseService, OAuthConfig, OAuthTokens
+from .base import HTTP_TIMEOUT, OAuthBaseService, OAuthConfig, OAuthTokens
+
+logger = logging.getLogger(__name__)
 
 
 class TwitterOAuthService(OAuthBaseService):
@@ -23,6 +26,8 @@ class TwitterOAuthService(OAuthBaseService):
     Migrated from: TwitterOAuthService in TwitterOAuthService.ts
     """
     
+    revokes_tokens = True
+    
     def __init__(self):
         config = OAuthConfig(
             client_id=settings.TWITTER_CLIENT_ID,
@@ -98,14 +103,14 @@ class TwitterOAuthService(OAuthBaseService):
         try:
             cache.set(redis_key, code_verifier, timeout=600)  # 10 minutes
         except Exception as e:
-            print(f'[twitter] Failed to store code verifier in cache: {e}')
+            logger.warning('[twitter] Failed to store code verifier in cache: %s', e)
         
         # Build authorization URL
         params = {
             'client_id': self.config.client_id,
             'redirect_uri': self.config.redirect_uri,
             'response_type': 'code',
-            'scope': ' '.join(self.config.scopes),
+            'scope': self.scope_string,
             'state': state,
             'code_challenge': code_challenge,
             'code_challenge_method': 'S256',
@@ -141,7 +146,7 @@ class TwitterOAuthService(OAuthBaseService):
         code_verifier = cache.get(redis_key)
         
         if not code_verifier:
-            print(f'[twitter] Code verifier not found in cache for state: {state}')
+            logger.warning('[twitter] Code verifier not found in cache for state: %s', state)
             raise Exception('Code verifier not found. Authorization may have expired.')
         
         try:
@@ -150,7 +155,7 @@ class TwitterOAuthService(OAuthBaseService):
                 f"{self.config.client_id}:{self.config.client_secret}".encode()
             ).decode()
             
-            response = requests.post(
+            response = self.session.post(
                 self.config.token_url,
                 data={
                     'code': code,
@@ -163,7 +168,7 @@ class TwitterOAuthService(OAuthBaseService):
                     'Content-Type': 'application/x-www-form-urlencoded',
                     'Authorization': f'Basic {credentials}',
                 },
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             
@@ -178,10 +183,10 @@ class TwitterOAuthService(OAuthBaseService):
                 try:
                     error_data = e.response.json()
                     error_msg = error_data.get('error_description', str(e))
-                except:
+                except (ValueError, AttributeError):
                     pass
             
-            print(f'[twitter] Token exchange failed: {error_msg}')
+            logger.error('[twitter] Token exchange failed: %s', error_msg)
             raise Exception(f'Failed to exchange authorization code: {error_msg}')
     
     def refresh_access_token(
@@ -209,7 +214,7 @@ class TwitterOAuthService(OAuthBaseService):
         
         for retry in range(max_retries):
             try:
-                response = requests.post(
+                response = self.session.post(
                     self.config.token_url,
                     data={
                         'refresh_token': refresh_token,
@@ -220,14 +225,14 @@ class TwitterOAuthService(OAuthBaseService):
                         'Content-Type': 'application/x-www-form-urlencoded',
                         'Authorization': f'Basic {credentials}',
                     },
-                    timeout=10
+                    timeout=HTTP_TIMEOUT
                 )
                 response.raise_for_status()
                 
                 return self.parse_token_response(response.json())
             
             except requests.RequestException as e:
-                print(f'[twitter] Token refresh attempt {retry + 1}/{max_retries} failed: {e}')
+                logger.warning('[twitter] Token refresh attempt %d/%d failed: %s', retry + 1, max_retries, e)
                 
                 if retry >= max_retries - 1:
                     error_msg = str(e)
@@ -235,7 +240,7 @@ class TwitterOAuthService(OAuthBaseService):
                         try:
                             error_data = e.response.json()
                             error_msg = error_data.get('error_description', str(e))
-                        except:
+                        except (ValueError, AttributeError):
                             pass
                     raise Exception(f'Failed to refresh token after {max_retries} attempts: {error_msg}')
                 
@@ -258,12 +263,12 @@ class TwitterOAuthService(OAuthBaseService):
             Dict with 'userId' and 'username'
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 'https://api.twitter.com/2/users/me',
                 headers={
                     'Authorization': f'Bearer {access_token}',
                 },
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             
@@ -274,43 +279,37 @@ class TwitterOAuthService(OAuthBaseService):
             }
         
         except requests.RequestException as e:
-            print(f'[twitter] Failed to get user info: {e}')
+            logger.error('[twitter] Failed to get user info: %s', e)
             raise Exception('Failed to retrieve Twitter user information')
     
-    def revoke_token(self, account_id: str) -> None:
+    def revoke_access_token(self, access_token: str) -> None:
         """
         Revoke Twitter OAuth token
         
         Migrated from: revokeToken() in TwitterOAuthService.ts
         
         Args:
-            account_id: Connected account ID
+            access_token: Access token to revoke
         """
-        try:
-            tokens = self.get_stored_tokens(account_id)
-            credentials = base64.b64encode(
-                f"{self.config.client_id}:{self.config.client_secret}".encode()
-            ).decode()
-            
-            requests.post(
-                'https://api.twitter.com/2/oauth2/revoke',
-                data={
-                    'token': tokens.access_token,
-                    'token_type_hint': 'access_token',
-                    'client_id': self.config.client_id,
-                },
-                headers={
-                    'Content-Type': 'application/x-www-form-urlencoded',
-                    'Authorization': f'Basic {credentials}',
-                },
-                timeout=10
-            )
-            
-            print('[twitter] Token revoked successfully')
+        credentials = base64.b64encode(
+            f"{self.config.client_id}:{self.config.client_secret}".encode()
+        ).decode()
         
-        except Exception as e:
-            print(f'[twitter] Token revocation failed: {e}')
-            # Don't throw error - mark as inactive anyway
+        self.session.post(
+            'https://api.twitter.com/2/oauth2/revoke',
+            data={
+                'token': access_token,
+                'token_type_hint': 'access_token',
+                'client_id': self.config.client_id,
+            },
+            headers={
+                'Content-Type': 'application/x-www-form-urlencoded',
+                'Authorization': f'Basic {credentials}',
+            },
+            timeout=HTTP_TIMEOUT
+        )
+        
+        logger.info('[twitter] Token revoked successfully')
 
 
 # Create singleton instance
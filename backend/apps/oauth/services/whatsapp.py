@@ -5,11 +5,14 @@ Uses WhatsApp Cloud API with system user tokens.
 Migrated from backend/src/services/oauth/WhatsAppOAuthService.ts
 """
 
+import logging
 from typing import Dict, Optional
 from django.conf import settings
 import requests
 
-from .base import OAuthBaseService, OAuthConfig, OAuthTokens
+from .base import HTTP_TIMEOUT, OAuthBaseService, OAuthConfig, OAuthTokens
+
+logger = logging.getLogger(__name__)
 
 
 class WhatsAppOAuthService(OAuthBaseService):
@@ -81,7 +84,7 @@ class WhatsAppOAuthService(OAuthBaseService):
             OAuth tokens
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 self.config.token_url,
                 params={
                     'client_id': self.config.client_id,
@@ -89,7 +92,7 @@ class WhatsAppOAuthService(OAuthBaseService):
                     'code': code,
                     'redirect_uri': self.config.redirect_uri,
                 },
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             data = response.json()
@@ -109,10 +112,10 @@ class WhatsAppOAuthService(OAuthBaseService):
                 try:
                     error_data = e.response.json()
                     error_msg = error_data.get('error', {}).get('message', str(e))
-                except:
+                except (ValueError, AttributeError):
                     pass
             
-            print(f'[whatsapp] Token exchange failed: {error_msg}')
+            logger.error('[whatsapp] Token exchange failed: %s', error_msg)
             raise Exception(f'Failed to exchange authorization code: {error_msg}')
     
     def refresh_access_token(
@@ -155,10 +158,10 @@ class WhatsAppOAuthService(OAuthBaseService):
         """
         try:
             # Get phone number details
-            response = requests.get(
+            response = self.session.get(
                 f'https://graph.facebook.com/v18.0/{self.phone_number_id}',
                 params={'access_token': access_token},
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             data = response.json()
@@ -169,7 +172,7 @@ class WhatsAppOAuthService(OAuthBaseService):
             }
         
         except requests.RequestException as e:
-            print(f'[whatsapp] Failed to get user info: {e}')
+            logger.error('[whatsapp] Failed to get user info: %s', e)
             raise Exception('Failed to retrieve WhatsApp Business account information')
     
     def verify_webhook(self, mode: str, token: str, challenge: str) -> Optional[str]:
@@ -189,10 +192,10 @@ class WhatsAppOAuthService(OAuthBaseService):
         verify_token = getattr(settings, 'WHATSAPP_VERIFY_TOKEN', 'whatsapp_verify_token')
         
         if mode == 'subscribe' and token == verify_token:
-            print('[whatsapp] Webhook verified successfully')
+            logger.info('[whatsapp] Webhook verified successfully')
             return challenge
         
-        print('[whatsapp] Webhook verification failed')
+        logger.warning('[whatsapp] Webhook verification failed')
         return None
     
     def get_business_profile(self, access_token: str) -> Dict:
@@ -208,10 +211,10 @@ class WhatsAppOAuthService(OAuthBaseService):
             Business profile information
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f'https://graph.facebook.com/v18.0/{self.phone_number_id}/whatsapp_business_profile',
                 params={'access_token': access_token},
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             data = response.json()
@@ -219,7 +222,7 @@ class WhatsAppOAuthService(OAuthBaseService):
             return data.get('data', [{}])[0]
         
         except requests.RequestException as e:
-            print(f'[whatsapp] Failed to get business profile: {e}')
+            logger.error('[whatsapp] Failed to get business profile: %s', e)
             raise Exception('Failed to retrieve WhatsApp Business profile')
     
     def register_webhook(self, access_token: str, webhook_url: str) -> bool:
@@ -236,18 +239,18 @@ class WhatsAppOAuthService(OAuthBaseService):
             True if successful
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 f'https://graph.facebook.com/v18.0/{self.phone_number_id}/subscribed_apps',
                 params={'access_token': access_token},
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             
-            print('[whatsapp] Webhook registered successfully')
+            logger.info('[whatsapp] Webhook registered successfully')
             return response.json().get('success') is True
         
         except requests.RequestException as e:
-            print(f'[whatsapp] Webhook registration failed: {e}')
+            logger.error('[whatsapp] Webhook registration failed: %s', e)
             return False
     
     def revoke_token(self, account_id: str) -> None:
@@ -259,7 +262,7 @@ class WhatsAppOAuthService(OAuthBaseService):
         Args:
             account_id: Connected account ID
         """
-        print('[whatsapp] System user tokens cannot be revoked programmatically')
+        logger.debug('[whatsapp] System user tokens cannot be revoked programmatically')
         # System user tokens are managed at the app level
         # Actual revocation happens when user removes app permissions
     
@@ -276,15 +279,15 @@ class WhatsAppOAuthService(OAuthBaseService):
             True if token is valid
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f'https://graph.facebook.com/v18.0/{self.phone_number_id}',
                 params={'access_token': access_token},
-                timeout=10
+                timeout=HTTP_TIMEOUT
             )
             response.raise_for_status()
             return 'id' in response.json()
         
-        except:
+        except (requests.RequestException, ValueError):
             return False
 
 
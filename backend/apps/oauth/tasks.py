@@ -0,0 +1,142 @@
+"""
+OAuth background tasks.
+
+Celery tasks for keeping connected-account tokens fresh.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from celery import shared_task
+from django.db import connection
+from django.utils import timezone
+import logging
+import requests
+
+from apps.core.utils.crypto import decrypt
+from .models import ConnectedAccount
+from .services.base import acquire_refresh_lock, release_refresh_lock
+
+logger = logging.getLogger(__name__)
+
+# Refresh tokens this long before they expire, so ensure_valid_token()
+# (which refreshes inline inside TOKEN_EXPIRY_BUFFER) rarely has to
+REFRESH_HORIZON = timedelta(minutes=30)
+
+# Bound on accounts per run; anything left over is picked up next run
+MAX_ACCOUNTS_PER_RUN = 500
+
+# Tokens that expired longer ago than this are left to the inline refresh.
+# A healthy account is refreshed REFRESH_HORIZON before expiry, so one that
+# is still expired an hour later had its refresh rejected (revoked grant,
+# removed app). Without the cutoff those rows would sort first on every
+# run and, once there are MAX_ACCOUNTS_PER_RUN of them, starve live ones.
+EXPIRED_GRACE = timedelta(hours=1)
+
+# Provider calls are I/O bound, so overlap them
+REFRESH_CONCURRENCY = 8
+
+
+def _refresh_account(account_id, service):
+    """
+    Refresh one account's tokens while holding its refresh lock
+
+    Runs on a pool thread. The lock is held only for this account's
+    re-read, provider call and write, so it never has to outlive the
+    rest of the batch.
+
+    Returns:
+        True if the tokens were refreshed
+    """
+    lock = acquire_refresh_lock(account_id)
+    if lock is None:
+        return False  # An inline ensure_valid_token() refresh is in progress
+
+    try:
+        # Re-read under the lock: a token refreshed inline since the
+        # candidate query no longer needs it
+        refresh_token = ConnectedAccount.objects.filter(
+            id=account_id,
+            is_active=True,
+            refresh_token__isnull=False,
+            token_expires_at__lt=timezone.now() + REFRESH_HORIZON
+        ).values_list('refresh_token', flat=True).first()
+        if not refresh_token:
+            return False
+
+        tokens = service.refresh_tokens(decrypt(refresh_token))
+        service.update_stored_tokens(account_id, tokens)
+        return True
+
+    except Exception as e:
+        logger.warning('Background token refresh failed for account %s: %s', account_id, e)
+        return False
+
+    finally:
+        release_refresh_lock(lock)
+        # Pool threads don't go through Django's request cycle, so close
+        # the connection this thread opened
+        connection.close()
+
+
+@shared_task(name='apps.oauth.tasks.refresh_expiring_tokens')
+def refresh_expiring_tokens():
+    """
+    Refresh OAuth tokens that expire within REFRESH_HORIZON
+    Runs every 10 minutes (configured in celery.py)
+
+    Accounts are refreshed concurrently on a small thread pool, each
+    under its own refresh lock (see _refresh_account). Accounts whose
+    lock is held (an inline ensure_valid_token() refresh in progress)
+    are skipped until the next run.
+    """
+    from .views import get_oauth_service
+
+    try:
+        now = timezone.now()
+        jobs = []
+        for account_id, platform in ConnectedAccount.objects.filter(
+            is_active=True,
+            refresh_token__isnull=False,
+            token_expires_at__gt=now - EXPIRED_GRACE,
+            token_expires_at__lt=now + REFRESH_HORIZON
+        ).order_by('token_expires_at').values_list('id', 'platform')[:MAX_ACCOUNTS_PER_RUN]:
+            try:
+                jobs.append((account_id, get_oauth_service(platform)))
+            except ValueError:
+                continue  # Cookie/session platforms have no OAuth refresh
+
+        with ThreadPoolExecutor(max_workers=REFRESH_CONCURRENCY) as pool:
+            refreshed = sum(pool.map(lambda job: _refresh_account(*job), jobs))
+
+        logger.info('Refreshed %d of %d expiring OAuth tokens', refreshed, len(jobs))
+        return f'Refreshed {refreshed} tokens'
+
+    except Exception as e:
+        logger.error('Failed to refresh expiring tokens: %s', e)
+        raise
+
+
+@shared_task(
+    bind=True,
+    name='apps.oauth.tasks.revoke_provider_token',
+    max_retries=3,
+    default_retry_delay=60
+)
+def revoke_provider_token(self, platform, encrypted_access_token):
+    """
+    Revoke an access token with the platform after the account was
+    disconnected
+
+    Queued by DisconnectAccountView so the disconnect doesn't wait on the
+    provider. The token is passed still encrypted, so it never sits in
+    the broker in plain text.
+    """
+    from .views import get_oauth_service
+
+    service = get_oauth_service(platform)
+    try:
+        service.revoke_access_token(decrypt(encrypted_access_token))
+    except requests.RequestException as e:
+        logger.warning('[%s] Token revocation failed, retrying: %s', platform, e)
+        raise self.retry(exc=e)
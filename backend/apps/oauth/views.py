@@ -16,8 +16,11 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated, AllowAny
+from adrf.views import APIView as AsyncAPIView
+from asgiref.sync import sync_to_async
 
 from .models import ConnectedAccount
+from .tasks import revoke_provider_token
 from .services.base import OAuthBaseService
 from .services.facebook import facebook_oauth_service
 from .services.twitter import twitter_oauth_service
@@ -122,22 +125,25 @@ class InitiateConnectionView(APIView):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-class OAuthCallbackView(APIView):
+class OAuthCallbackView(AsyncAPIView):
     """
     Handle OAuth callback
     
     GET/POST /api/oauth/callback/:platform
     Migrated from: handleCallback() in oauthController.ts
+    
+    Async so the provider round trips (token exchange, user info) don't
+    hold a worker thread while they wait on the network.
     """
     permission_classes = [AllowAny]
     
-    def get(self, request, platform):
-        return self._handle_callback(request, platform, request.GET)
+    async def get(self, request, platform):
+        return await self._handle_callback(request, platform, request.GET)
     
-    def post(self, request, platform):
-        return self._handle_callback(request, platform, request.data)
+    async def post(self, request, platform):
+        return await self._handle_callback(request, platform, request.data)
     
-    def _handle_callback(self, request, platform, data):
+    async def _handle_callback(self, request, platform, data):
         try:
             # For Telegram, data comes in POST body
             is_telegram = platform == 'telegram'
@@ -164,7 +170,7 @@ class OAuthCallbackView(APIView):
                 }, status=400)
             
             # Verify state parameter from cache
-            state_data_str = cache.get(f'oauth:state:{state}')
+            state_data_str = await cache.aget(f'oauth:state:{state}')
             if not state_data_str:
                 print(f'[oauth] State not found in cache: {state}')
                 return JsonResponse({
@@ -187,25 +193,31 @@ class OAuthCallbackView(APIView):
                 }, status=400)
             
             # Clean up state from cache
-            cache.delete(f'oauth:state:{state}')
+            await cache.adelete(f'oauth:state:{state}')
             
             user_id = state_data['userId']
             
             # Get OAuth service
             oauth_service = get_oauth_service(platform)
             
-            # For Telegram, validate auth data and get user info directly
-            if platform == 'telegram':
-                # Telegram sends user data directly
-                tokens = oauth_service.exchange_code_for_token('', data)
-                user_info = oauth_service.get_user_info(tokens.access_token, data)
-            else:
+            # Provider calls only, no ORM, so they can run off the
+            # thread-sensitive executor and overlap with other callbacks
+            @sync_to_async(thread_sensitive=False)
+            def fetch_tokens_and_user_info():
+                # For Telegram, validate auth data and get user info directly
+                if platform == 'telegram':
+                    # Telegram sends user data directly
+                    tokens = oauth_service.exchange_code_for_token('', data)
+                    return tokens, oauth_service.get_user_info(tokens.access_token, data)
+                
                 # Standard OAuth flow
                 tokens = oauth_service.exchange_code_for_token(code, {'state': state})
-                user_info = oauth_service.get_user_info(tokens.access_token)
+                return tokens, oauth_service.get_user_info(tokens.access_token)
+            
+            tokens, user_info = await fetch_tokens_and_user_info()
             
             # Store tokens securely
-            account_id = oauth_service.store_tokens(
+            account_id = await sync_to_async(oauth_service.store_tokens)(
                 user_id,
                 user_info['userId'],
                 user_info['username'],
@@ -322,10 +334,12 @@ class DisconnectAccountView(APIView):
             
             platform = account.platform
             
-            # Attempt to revoke token with platform
+            # Revoke the token with the platform in the background; the
+            # task gets the (encrypted) token before it is cleared below
             try:
                 oauth_service = get_oauth_service(platform)
-                oauth_service.revoke_token(account_id)
+                if oauth_service.revokes_tokens and account.access_token:
+                    revoke_provider_token.delay(platform, account.access_token)
             except Exception as e:
                 print(f'[oauth] Failed to revoke token for {platform}: {e}')
                 # Continue with disconnection even if revocation fails
@@ -416,7 +430,7 @@ class DisconnectAccountView(APIView):
             # Don't fail the disconnection if cache cleanup fails
 
 
-class RefreshTokenView(APIView):
+class RefreshTokenView(AsyncAPIView):
     """
     Refresh token for an account
     
@@ -425,7 +439,7 @@ class RefreshTokenView(APIView):
     """
     permission_classes = [AllowAny]  # Check JWT in middleware
     
-    def post(self, request, account_id):
+    async def post(self, request, account_id):
         try:
             if not hasattr(request, 'user_jwt') or not request.user_jwt:
                 return Response({
@@ -440,7 +454,7 @@ class RefreshTokenView(APIView):
             
             # Verify account belongs to user
             try:
-                account = ConnectedAccount.objects.get(
+                account = await ConnectedAccount.objects.only('platform').aget(
                     id=account_id,
                     user_id=user_id,
                     is_active=True
@@ -458,7 +472,7 @@ class RefreshTokenView(APIView):
             oauth_service = get_oauth_service(platform)
             
             # Ensure valid token (will refresh if needed)
-            oauth_service.ensure_valid_token(str(account_id))
+            await sync_to_async(oauth_service.ensure_valid_token)(str(account_id))
             
             return Response({
                 'success': True,
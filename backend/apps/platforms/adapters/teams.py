@@ -5,15 +5,27 @@ Migrated from backend/src/adapters/TeamsAdapter.ts
 Updated to improve sign-in compatibility and keep Graph scopes consistent.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
-from datetime import datetime, timedelta
+from datetime import datetime
+from urllib.parse import quote, urlencode
 import requests
-from django.conf import settings
-from django.utils import timezone
 
 from .base import BasePlatformAdapter
 from apps.oauth.models import ConnectedAccount
-from apps.core.utils.crypto import decrypt, encrypt
+from apps.oauth.services.base import http_session
+from apps.oauth.services.teams import teams_oauth_service
+
+# Microsoft Graph accepts at most 20 requests per JSON $batch
+GRAPH_BATCH_LIMIT = 20
+
+# Batch sub-responses with these statuses are retried as individual
+# requests (the pooled session honours Retry-After on GETs)
+GRAPH_RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+# $batch requests in flight at once; kept low because Graph throttles
+# chat APIs per app and per user
+GRAPH_BATCH_CONCURRENCY = 4
 
 
 class TeamsAdapter(BasePlatformAdapter):
@@ -32,115 +44,36 @@ class TeamsAdapter(BasePlatformAdapter):
         super().__init__('teams')
         self.timeout = 30
         
-        # Use configured tenant when provided, otherwise default to `common`
-        # so sign-in works across org boundaries.
-        tenant_id = getattr(settings, 'MICROSOFT_TENANT_ID', None)
-        if not tenant_id:
-            tenant_id = 'common'
-        
-        self.token_url = f'https://login.microsoftonline.com/{tenant_id}/oauth2/v2.0/token'
-        self.tenant_id = tenant_id
+        # Graph and token endpoint calls share the OAuth services' pooled
+        # keep-alive session instead of a new connection per request
+        self.session = http_session
     
     def get_access_token(self, account_id: str) -> str:
         """
-        Get access token for the account
+        Get access token for the account, refreshing it first if needed
         
         Migrated from: getAccessToken() in TeamsAdapter.ts
         """
         try:
-            account = ConnectedAccount.objects.get(id=account_id, is_active=True)
-            
-            # Check if token needs refresh
-            self.refresh_token_if_needed(account_id)
-            
-            # Fetch again after potential refresh
-            account.refresh_from_db()
-            return decrypt(account.access_token)
-        
-        except ConnectedAccount.DoesNotExist:
-            raise Exception(f'Account {account_id} not found or inactive')
+            return teams_oauth_service.ensure_valid_token(account_id)
+        except Exception as e:
+            print(f'[teams] Failed to get access token: {e}')
+            raise Exception(f'Failed to get Microsoft Teams access token for account {account_id}: {e}')
     
     def refresh_token_if_needed(self, account_id: str) -> None:
         """
         Refresh token if expired (Teams tokens expire in 1 hour)
         
+        Delegates to the OAuth service, which refreshes under the
+        per-account refresh lock and re-reads the tokens once it holds
+        it: concurrent syncs of one account make a single token request
+        and the rest pick up its result.
+        
         Migrated from: refreshTokenIfNeeded() in TeamsAdapter.ts
         
         Requirements: 8.4 - Refresh token automatically when expired
         """
-        try:
-            account = ConnectedAccount.objects.get(id=account_id)
-            
-            # Check if token expires within the next 5 minutes
-            if not account.token_expires_at:
-                return
-            
-            now = timezone.now()
-            five_minutes_from_now = now + timedelta(minutes=5)
-            
-            if account.token_expires_at > five_minutes_from_now:
-                return  # Token is still valid
-            
-            # Refresh the token
-            if not account.refresh_token:
-                raise Exception(f'No refresh token available for account {account_id}. User needs to re-authenticate.')
-            
-            client_id = getattr(settings, 'MICROSOFT_CLIENT_ID', '')
-            client_secret = getattr(settings, 'MICROSOFT_CLIENT_SECRET', '')
-            
-            if not client_id or not client_secret:
-                raise Exception('Microsoft Teams OAuth credentials not configured')
-            
-            refresh_token = decrypt(account.refresh_token)
-            
-            # Keep scopes aligned with OAuth consent scopes.
-            scopes = [
-                'offline_access',
-                'User.Read',
-                'Chat.Read',
-                'Chat.ReadWrite',
-            ]
-            
-            response = requests.post(
-                self.token_url,
-                data={
-                    'grant_type': 'refresh_token',
-                    'refresh_token': refresh_token,
-                    'client_id': client_id,
-                    'client_secret': client_secret,
-                    'scope': ' '.join(scopes),
-                },
-                headers={'Content-Type': 'application/x-www-form-urlencoded'},
-                timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            # Update account with new tokens
-            account.access_token = encrypt(data['access_token'])
-            if data.get('refresh_token'):
-                account.refresh_token = encrypt(data['refresh_token'])
-            account.token_expires_at = now + timedelta(seconds=data.get('expires_in', 3600))
-            account.save()
-            
-            print(f'[teams] Token refreshed for account {account_id}')
-        
-        except requests.RequestException as e:
-            error_msg = str(e)
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    error_data = e.response.json()
-                    error_msg = error_data.get('error_description', str(e))
-                    error_code = error_data.get('error')
-                    if error_code == 'invalid_grant':
-                        error_msg = 'Refresh token expired or revoked. User needs to re-authenticate.'
-                except:
-                    pass
-            print(f'[teams] Failed to refresh token: {error_msg}')
-            raise Exception(f'Failed to refresh Microsoft Teams access token: {error_msg}')
-        except Exception as e:
-            print(f'[teams] Failed to refresh token: {e}')
-            raise Exception(f'Failed to refresh Microsoft Teams access token: {e}')
+        self.get_access_token(account_id)
     
     def fetch_messages(self, account_id: str, since: Optional[datetime] = None) -> List[Dict]:
         """
@@ -158,7 +91,7 @@ class TeamsAdapter(BasePlatformAdapter):
             chats_url = f'{self.BASE_URL}/me/chats'
             
             try:
-                chats_response = requests.get(
+                chats_response = self.session.get(
                     chats_url,
                     headers={'Authorization': f'Bearer {token}'},
                     params={'$top': 50},  # Limit number of chats
@@ -178,19 +111,112 @@ class TeamsAdapter(BasePlatformAdapter):
             chats = chats_response.json().get('value', [])
             all_messages = []
             
-            # Fetch messages for each chat
-            for chat in chats:
+            # Fetch messages for all chats with $batch, 20 chats per request
+            paths = {self._chat_messages_path(chat['id'], since): chat['id'] for chat in chats}
+            results = self._batch_get(token, list(paths))
+            
+            for path, chat_id in paths.items():
+                result = results.get(path)
+                status = result.get('status') if result else None
+                
+                if status and 200 <= status < 300:
+                    all_messages.extend(self._parse_chat_messages(
+                        result.get('body', {}).get('value', []),
+                        chat_id,
+                        account.platform_user_id
+                    ))
+                    continue
+                
+                if status is not None and status not in GRAPH_RETRYABLE_STATUSES:
+                    print(f'[teams] Failed to fetch messages for chat {chat_id}: HTTP {status}')
+                    continue  # Continue with other chats
+                
+                # Throttled, or the batch itself failed: fetch this chat alone
                 try:
-                    messages = self._fetch_chat_messages(token, chat['id'], account.platform_user_id, since)
+                    messages = self._fetch_chat_messages(token, chat_id, account.platform_user_id, since)
                     all_messages.extend(messages)
                 except Exception as e:
-                    print(f'[teams] Failed to fetch messages for chat {chat["id"]}: {e}')
+                    print(f'[teams] Failed to fetch messages for chat {chat_id}: {e}')
                     # Continue with other chats
             
             return all_messages
         
         return self.execute_with_retry(_fetch, account_id)
     
+    def _batch_get(self, token: str, paths: List[str]) -> Dict[str, Dict]:
+        """
+        GET several Graph resources with JSON batching
+        
+        Paths are sent GRAPH_BATCH_LIMIT per $batch request, with up to
+        GRAPH_BATCH_CONCURRENCY batches in flight.
+        
+        Args:
+            token: Access token
+            paths: Resource paths relative to BASE_URL, with query string
+            
+        Returns:
+            Dict of path -> sub-response ('status', 'headers', 'body').
+            Paths whose batch request failed are left out, so the caller
+            can fall back to fetching them individually.
+        """
+        chunks = [
+            paths[start:start + GRAPH_BATCH_LIMIT]
+            for start in range(0, len(paths), GRAPH_BATCH_LIMIT)
+        ]
+        if not chunks:
+            return {}
+        
+        def send(chunk):
+            try:
+                response = self.session.post(
+                    f'{self.BASE_URL}/$batch',
+                    json={
+                        'requests': [
+                            {'id': str(i), 'method': 'GET', 'url': path}
+                            for i, path in enumerate(chunk)
+                        ],
+                    },
+                    headers={
+                        'Authorization': f'Bearer {token}',
+                        'Content-Type': 'application/json',
+                    },
+                    timeout=self.timeout
+                )
+                response.raise_for_status()
+            except requests.RequestException as e:
+                print(f'[teams] Batch request failed, falling back to single requests: {e}')
+                return {}
+            
+            return {
+                chunk[int(item['id'])]: item
+                for item in response.json().get('responses', [])
+            }
+        
+        if len(chunks) == 1:
+            return send(chunks[0])
+        
+        # Graph calls are I/O bound, so overlap the batches on the pooled session
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(len(chunks), GRAPH_BATCH_CONCURRENCY)) as pool:
+            for chunk_results in pool.map(send, chunks):
+                results.update(chunk_results)
+        
+        return results
+    
+    def _chat_messages_path(self, chat_id: str, since: Optional[datetime] = None) -> str:
+        """Path (relative to BASE_URL) of a chat's recent messages"""
+        params = {
+            '$top': 50,
+            '$orderby': 'createdDateTime desc',
+        }
+        
+        if since:
+            # Format datetime for OData filter
+            since_str = since.strftime('%Y-%m-%dT%H:%M:%SZ')
+            params['$filter'] = f'createdDateTime gt {since_str}'
+        
+        return f'/chats/{chat_id}/messages?{urlencode(params, safe="$:", quote_via=quote)}'
+    
     def _fetch_chat_messages(
         self, 
         token: str, 
@@ -212,26 +238,31 @@ class TeamsAdapter(BasePlatformAdapter):
             
         Requirements: 8.2 - Implement message history fetching
         """
-        messages_url = f'{self.BASE_URL}/chats/{chat_id}/messages'
-        params = {
-            '$top': 50,
-            '$orderby': 'createdDateTime desc',
-        }
-        
-        if since:
-            # Format datetime for OData filter
-            since_str = since.strftime('%Y-%m-%dT%H:%M:%SZ')
-            params['$filter'] = f'createdDateTime gt {since_str}'
-        
-        messages_response = requests.get(
-            messages_url,
+        messages_response = self.session.get(
+            f'{self.BASE_URL}{self._chat_messages_path(chat_id, since)}',
             headers={'Authorization': f'Bearer {token}'},
-            params=params,
             timeout=self.timeout
         )
         messages_response.raise_for_status()
         
-        teams_messages = messages_response.json().get('value', [])
+        return self._parse_chat_messages(
+            messages_response.json().get('value', []),
+            chat_id,
+            user_id
+        )
+    
+    def _parse_chat_messages(self, teams_messages: List[Dict], chat_id: str, user_id: str) -> List[Dict]:
+        """
+        Convert Graph chatMessage resources into message dictionaries
+        
+        Args:
+            teams_messages: 'value' list of a chat messages response
+            chat_id: Chat ID
+            user_id: Current user's platform ID
+            
+        Returns:
+            List of message dictionaries
+        """
         messages = []
         
         for msg in teams_messages:
@@ -285,7 +316,7 @@ class TeamsAdapter(BasePlatformAdapter):
             url = f'{self.BASE_URL}/chats/{conversation_id}/messages'
             
             try:
-                response = requests.post(
+                response = self.session.post(
                     url,
                     json={
                         'body': {
@@ -394,7 +425,7 @@ class TeamsAdapter(BasePlatformAdapter):
                     for m in mentions
                 ]
             
-            response = requests.post(
+            response = self.session.post(
                 url,
                 json=body,
                 headers={
@@ -451,7 +482,7 @@ class TeamsAdapter(BasePlatformAdapter):
             
             try:
                 # Request chats with members expanded for efficiency
-                response = requests.get(
+                response = self.session.get(
                     url,
                     headers={'Authorization': f'Bearer {token}'},
                     params={
@@ -569,7 +600,7 @@ class TeamsAdapter(BasePlatformAdapter):
             List of member dictionaries
         """
         members_url = f'{self.BASE_URL}/chats/{chat_id}/members'
-        members_response = requests.get(
+        members_response = self.session.get(
             members_url,
             headers={'Authorization': f'Bearer {token}'},
             timeout=self.timeout
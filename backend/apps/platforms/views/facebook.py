@@ -594,7 +594,7 @@ class FacebookPendingMessagesView(APIView):
                     'id': str(msg.id),
                     'platformConversationId': msg.platform_conversation_id,
                     'recipientId': msg.recipient_id,
-                    'content': msg.content,
+                    'content': msg.plain_content,
                     'createdAt': msg.created_at.isoformat(),
                 })
             
@@ -637,7 +637,6 @@ class FacebookMessageSentView(APIView):
                 }, status=status.HTTP_400_BAD_REQUEST)
             
             from apps.messaging.models import PendingOutgoingMessage, Message
-            from apps.core.utils.crypto import encrypt
             from django.utils import timezone
             
             try:
@@ -659,7 +658,7 @@ class FacebookMessageSentView(APIView):
                         platform_message_id=platform_message_id or f'fb_sent_{timezone.now().timestamp()}',
                         sender_id='me',
                         sender_name='You',
-                        content=encrypt(pending_msg.content),
+                        content=pending_msg.encrypted_content,
                         message_type='text',
                         is_outgoing=True,
                         is_read=True,
@@ -680,7 +680,7 @@ class InstagramSendMessageView(APIView):
                 platform='instagram',
                 platform_conversation_id=conversation.platform_conversation_id,
                 recipient_id=conversation.participant_id,
-                content=content.strip(),
+                content=encrypt(content.strip()),
                 status='pending'
             )
             
@@ -747,7 +747,7 @@ class InstagramPendingMessagesView(APIView):
                     'conversationId': str(msg.conversation_id),
                     'platformConversationId': msg.platform_conversation_id,
                     'recipientId': msg.recipient_id,
-                    'content': msg.content,
+                    'content': msg.plain_content,
                     'createdAt': msg.created_at.isoformat(),
                 })
             
@@ -798,7 +798,6 @@ class InstagramMessageSentView(APIView):
                 }, status=status.HTTP_400_BAD_REQUEST)
             
             from apps.messaging.models import PendingOutgoingMessage, Message
-            from apps.core.utils.crypto import encrypt
             
             try:
                 pending = PendingOutgoingMessage.objects.get(id=pending_id, user_id=user_id)
@@ -812,7 +811,7 @@ class InstagramMessageSentView(APIView):
                 message = Message.objects.create(
                     conversation=pending.conversation,
                     platform_message_id=platform_message_id or f'desktop_{pending.id}',
-                    content=encrypt(pending.content),
+                    content=pending.encrypted_content,
                     sender_id=str(pending.account.platform_user_id),
                     sender_name='You',
                     is_outgoing=True,
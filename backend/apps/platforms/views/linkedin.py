@@ -989,7 +989,7 @@ class LinkedInPendingMessagesView(APIView):
                     'conversationId': str(msg.conversation.id) if msg.conversation else '',
                     'platformConversationId': msg.conversation.platform_conversation_id if msg.conversation else '',
                     'recipientName': msg.conversation.participant_name if msg.conversation else '',  # Include recipient name for matching
-                    'content': msg.content,  # Already decrypted by property
+                    'content': msg.plain_content,
                     'createdAt': msg.created_at.isoformat(),
                 })
             
@@ -1036,7 +1036,6 @@ class LinkedInMessageSentView(APIView):
                 }, status=status.HTTP_400_BAD_REQUEST)
             
             from apps.messaging.models import PendingOutgoingMessage, Message
-            from apps.core.utils.crypto import encrypt
             
             try:
                 pending = PendingOutgoingMessage.objects.get(id=pending_id, account__user_id=user_id)
@@ -1051,7 +1050,7 @@ class LinkedInMessageSentView(APIView):
                     Message.objects.create(
                         conversation=pending.conversation,
                         platform_message_id=platform_message_id or f'li_sent_{pending.id}',
-                        content=encrypt(pending.content),
+                        content=pending.encrypted_content,
                         sender_id=str(pending.account.platform_user_id),
                         sender_name='You',
                         sent_at=timezone.now(),
@@ -526,7 +526,7 @@ class WhatsAppSyncFromDesktopView(APIView):
                         
                         # Map message type to valid choices
                         msg_type = msg_data.get('type', 'text')
-                        if msg_type not in ['text', 'image', 'video', 'file']:
+                        if msg_type not in Message.MESSAGE_TYPES:
                             msg_type = 'text'  # Default to text for unknown types
                         
                         # Sanitize content for MySQL
@@ -620,7 +620,7 @@ class WhatsAppPendingMessagesView(APIView):
                     'id': str(msg.id),
                     'platformConversationId': msg.platform_conversation_id,
                     'recipientId': msg.recipient_id,
-                    'content': msg.content,
+                    'content': msg.plain_content,
                     'createdAt': msg.created_at.isoformat(),
                 })
             
@@ -688,14 +688,12 @@ class WhatsAppMessageSentView(APIView):
             
             if success:
                 # Create the actual message in the database
-                from apps.core.utils.crypto import encrypt
-                
                 Message.objects.create(
                     conversation=pending_msg.conversation,
                     platform_message_id=platform_message_id or f'wa_sent_{pending_id}',
                     sender_id='me',
                     sender_name='You',
-                    content=encrypt(pending_msg.content),
+                    content=pending_msg.encrypted_content,
                     message_type='text',
                     is_outgoing=True,
                     is_read=True,
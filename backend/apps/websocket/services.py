@@ -7,7 +7,7 @@ Migrated from backend/src/services/websocketService.ts
 import asyncio
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
-from typing import Dict, Optional
+from typing import Awaitable, Dict, Optional
 
 
 class WebSocketService:
@@ -19,6 +19,8 @@ class WebSocketService:
     
     def __init__(self):
         self.channel_layer = get_channel_layer()
+        # Strong references to fire-and-forget emits so they aren't GC'd mid-flight
+        self._background_tasks = set()
     
     def _get_user_room(self, user_id: str) -> str:
         """Get the room name for a user"""
@@ -32,6 +34,22 @@ class WebSocketService:
         except RuntimeError:
             return False
     
+    def _on_background_task_done(self, task: asyncio.Task) -> None:
+        """Release a finished background emit and report its failure, if any"""
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            print(f'[websocket] Background emit failed: {task.exception()}')
+    
+    def run_in_background(self, coro: Awaitable) -> None:
+        """
+        Schedule an emit coroutine on the running event loop without awaiting it.
+        
+        Used by async views so socket I/O stays off the HTTP response path.
+        """
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_background_task_done)
+    
     async def _async_group_send(self, room: str, message: Dict) -> None:
         """Async version of group_send"""
         if self.channel_layer:
@@ -49,7 +67,7 @@ class WebSocketService:
         
         # Check if we're in async context - if so, schedule the coroutine
         if self._is_async_context():
-            asyncio.create_task(self.emit_new_message_async(user_id, message, conversation))
+            self.run_in_background(self.emit_new_message_async(user_id, message, conversation))
             return
         
         async_to_sync(self.channel_layer.group_send)(
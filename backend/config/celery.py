@@ -33,6 +33,10 @@ app.conf.beat_schedule = {
         'task': 'apps.authentication.tasks.cleanup_expired_tokens',
         'schedule': crontab(hour=2, minute=0),  # Every day at 2 AM
     },
+    'refresh-expiring-oauth-tokens': {
+        'task': 'apps.oauth.tasks.refresh_expiring_tokens',
+        'schedule': 10 * 60.0,  # Every 10 minutes
+    },
 }
 
 # Celery configuration options
@@ -184,6 +184,7 @@ else:
                 'init_command': "SET sql_mode='STRICT_TRANS_TABLES'",
             },
             'CONN_MAX_AGE': 600,
+            'CONN_HEALTH_CHECKS': True,
         }
     }
 
@@ -456,10 +457,26 @@ LOGGING = {
             'style': '{',
         },
     },
+    'filters': {
+        # Caps hot-path loggers at ~10 records/second so error storms
+        # (e.g. mass decrypt failures) don't dominate CPU and stdout
+        'rate_limited': {
+            '()': 'apps.core.utils.log_filters.RateLimitingFilter',
+            'rate': 10,
+            'per': 1.0,
+        },
+    },
     'handlers': {
+        # Writes happen on a listener thread so async views never block
+        # the event loop on stdout
         'console': {
-            'class': 'logging.StreamHandler',
+            'class': 'apps.core.utils.log_handlers.QueuedStreamHandler',
+            'formatter': 'verbose',
+        },
+        'console_rate_limited': {
+            'class': 'apps.core.utils.log_handlers.QueuedStreamHandler',
             'formatter': 'verbose',
+            'filters': ['rate_limited'],
         },
     },
     'root': {
@@ -472,5 +489,10 @@ LOGGING = {
             'level': 'INFO',
             'propagate': False,
         },
+        'apps.messaging': {
+            'handlers': ['console_rate_limited'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
     },
 }
@@ -0,0 +1,45 @@
+"""
+Property-based tests for encryption helpers.
+
+Verifies that the fast-path checks in is_encrypted never reject a value
+produced by encrypt(), and that short plaintext is rejected outright.
+"""
+
+from hypothesis import given, strategies as st, settings
+
+from apps.core.utils.crypto import (
+    MIN_ENCRYPTED_LENGTH,
+    decrypt,
+    encrypt,
+    is_encrypted,
+)
+
+
+plaintext_strategy = st.text(min_size=1, max_size=200)
+
+
+class TestIsEncrypted:
+    """Property-based tests for is_encrypted."""
+
+    @given(text=plaintext_strategy)
+    @settings(max_examples=100)
+    def test_encrypted_values_are_detected(self, text: str):
+        """
+        Property: Every value produced by encrypt() is recognised as encrypted
+        and round-trips through decrypt().
+        """
+        encrypted = encrypt(text)
+
+        assert is_encrypted(encrypted), \
+            f"encrypt() output {encrypted!r} should be detected as encrypted"
+        assert decrypt(encrypted) == text
+
+    @given(text=st.text(max_size=MIN_ENCRYPTED_LENGTH - 1))
+    @settings(max_examples=100)
+    def test_short_values_are_not_encrypted(self, text: str):
+        """
+        Property: Strings shorter than the smallest possible ciphertext
+        are never reported as encrypted.
+        """
+        assert not is_encrypted(text), \
+            f"Short value {text!r} should not be detected as encrypted"